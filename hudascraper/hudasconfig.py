@@ -39,6 +39,8 @@ class SelectorCandidate:
     multi_match: when True, expects multiple matching elements instead of
         a single match.
     strict: reserved for future enforcement of strict-match semantics.
+    locator_arg: derived selector string passed to ``locator()``; the raw
+        selector for CSS and ``xpath=``-prefixed for XPath.
     """
 
     selector: str
@@ -48,6 +50,12 @@ class SelectorCandidate:
     allow_unstable: bool = False
     multi_match: bool = False
     strict: bool = True  # TODO(Mark Dasco): implement handling of this data
+    locator_arg: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.locator_arg = (
+            self.selector if self.engine == "css" else "xpath=" + self.selector
+        )
 
 
 @dataclass
@@ -178,7 +186,7 @@ def coerce_nested(obj: dict, cls: type[Any]) -> Any:
 
     kwargs = {}
     for f in fields(cls):
-        if f.name not in obj:
+        if not f.init or f.name not in obj:
             continue
         val = obj[f.name]
         if val is MISSING:
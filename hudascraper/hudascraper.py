@@ -9,9 +9,13 @@ import argparse
 import contextlib
 import logging
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from time import monotonic
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from .hudasconfig import (
     Config,
@@ -22,14 +26,16 @@ from .hudasconfig import (
 from .hudasession import (
     _state_file,
     is_logged_in,
+    is_ms_login,
     load_context,
     save_context,
     wait_until,
 )
 
 if TYPE_CHECKING:
-    # typing-only imports
-    from collections.abc import Callable
+    from collections.abc import Iterator
+
+    import pandas as pd
 
     # Playwright types for static analysis
     try:  # pragma: no cover - only for typing
@@ -38,11 +44,6 @@ if TYPE_CHECKING:
         Locator = object  # type: ignore
         Page = object  # type: ignore
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
-
 try:
     from playwright.sync_api import Error as PlaywrightError
     from playwright.sync_api import Locator, Page, sync_playwright
@@ -81,14 +82,97 @@ See :mod:`hudascraper.hudasconfig` for the JSON configuration structure.
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
-if pd is None:
-    logger.debug("pandas not available; DataFrame conversion will raise if used")
+
+
+@lru_cache(1)
+def _pandas() -> Any:
+    """
+    Import pandas on first use and return the module, or None if missing.
+
+    Deferred so importing the package (CLI argument errors, API worker
+    start-up) does not pay pandas' import cost until a frame is built.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        logger.debug("pandas not available; DataFrame conversion will raise")
+        return None
+    return pd
+
 
 UNSTABLE_PATTERNS = [
     r":nth-(child|of-type)\(",  # brittle positional CSS
     r"//.*text\(\)\s*=",  # text-based XPath
     r"^/{1,2}(?!html)",  # absolute XPaths from root (allow 'html' root narrowly)
 ]
+# All unstable patterns as one alternation so validation is a single search
+_UNSTABLE_RE = re.compile("|".join(f"(?:{p})" for p in UNSTABLE_PATTERNS))
+
+# Collect innerText of every descendant matching a CSS selector in one call
+_INNER_TEXTS_JS = (
+    "(el, sel) => Array.from(el.querySelectorAll(sel)).map(e => e.innerText)"
+)
+
+# Last integer in a "Page 1 of 12"-style label
+_LAST_INT_RE = re.compile(r"(\d+)\D*$")
+
+# True once a marked row was removed or re-rendered with different text
+_ROW_CHANGED_JS = "([el, text]) => !el.isConnected || el.innerText !== text"
+
+# ASCII unit separator used to join row cells into a single dedupe key
+_ROW_SEP = "\x1f"
+
+# String fields of a candidate that are interned when building candidates
+_INTERNED_FIELDS = frozenset({"selector", "engine", "state"})
+
+
+@lru_cache(maxsize=1024)
+def _candidate(items: tuple[tuple[str, Any], ...]) -> SelectorCandidate:
+    """Build a :class:`SelectorCandidate` from frozen ``(key, value)`` items."""
+    kwargs = {
+        k: sys.intern(v) if k in _INTERNED_FIELDS and isinstance(v, str) else v
+        for k, v in items
+    }
+    return SelectorCandidate(**kwargs)
+
+
+def _cand(c: dict) -> SelectorCandidate:
+    """
+    Return a memoized :class:`SelectorCandidate` for the candidate dict ``c``.
+
+    Identical candidate dicts (which commonly repeat across pre_actions,
+    wait targets and pagination configs) share a single instance. Dicts
+    holding unhashable values fall back to a fresh, uncached instance.
+    """
+    try:
+        return _candidate(tuple(sorted(c.items())))
+    except TypeError:
+        return SelectorCandidate(**c)
+
+
+def _compile_pre_actions(
+    actions: list[dict],
+) -> list[tuple[str | None, str | None, SelectorSet | None, Any, int]]:
+    """
+    Pre-compile configured ``pre_actions`` into ready-to-run tuples.
+
+    Each entry becomes ``(action, selector, selset, value, pause_ms)`` where
+    ``selset`` is the :class:`SelectorSet` built from ``selector`` (or None
+    when no selector is configured). ``pause_ms`` defaults to 0: Playwright
+    already waits for actionability on click/fill/select, so a pause is
+    only taken when the config explicitly asks for one.
+    """
+    compiled = []
+    for act in actions:
+        sel = act.get("selector")
+        selset = SelectorSet([_cand({"selector": sel})]) if sel else None
+        try:
+            pause_ms = int(act.get("pause_ms", 0))
+        except (TypeError, ValueError):
+            logger.debug("pre_action has invalid pause_ms: %r", act.get("pause_ms"))
+            pause_ms = 0
+        compiled.append((act.get("action"), sel, selset, act.get("value"), pause_ms))
+    return compiled
 
 
 # ----------------------------
@@ -111,54 +195,91 @@ class SelectorResolver:
         self.page = page
 
     def _validate(self, cand: SelectorCandidate) -> None:
-        if cand.allow_unstable:
-            return
-        for pat in UNSTABLE_PATTERNS:
-            if re.search(pat, cand.selector):
-                msg = f"Rejected unstable selector: {cand.selector}"
-                raise ValueError(msg)
+        if not cand.allow_unstable and _UNSTABLE_RE.search(cand.selector):
+            msg = f"Rejected unstable selector: {cand.selector}"
+            raise ValueError(msg)
 
     def locate(self, root: Locator | Page, selset: SelectorSet) -> Locator:
+        return self._match(root, selset)[0]
+
+    def _match(
+        self,
+        root: Locator | Page,
+        selset: SelectorSet,
+    ) -> tuple[Locator, SelectorCandidate]:
+        """Return the locator and candidate of the first matching candidate."""
         last_err: Exception | None = None
         for cand in selset.candidates:
             try:
                 self._validate(cand)
                 loc = self._loc(root, cand)
 
-                # Wait for element — prefer waiting on the full locator when a
-                # single match is expected, but if Playwright raises a strict
-                # mode violation (multiple elements), fall back to waiting on
-                # the first element. This handles header/cell sets that match
-                # multiple nodes (e.g., multiple <th> elements).
-                try:
-                    if cand.multi_match:
-                        loc.first.wait_for(state=cand.state, timeout=cand.timeout_ms)
-                    else:
-                        loc.wait_for(state=cand.state, timeout=cand.timeout_ms)
-                except PlaywrightError as e:
-                    # If locator resolved to multiple elements, use the first
-                    # element as a pragmatic fallback and continue; re-raise
-                    # for other Playwright errors.
-                    msg = str(e)
-                    if "strict mode violation" in msg or "resolved to" in msg:
-                        loc.first.wait_for(
-                            state=cand.state,
-                            timeout=cand.timeout_ms,
-                        )
-                    else:
-                        raise
+                # Wait on the first matching element. Header/cell sets routinely
+                # match multiple nodes (e.g., multiple <th> elements), and a
+                # strict wait on the full locator would only raise a strict
+                # mode violation that ends up waiting on the first element
+                # anyway, so go there directly.
+                loc.first.wait_for(state=cand.state, timeout=cand.timeout_ms)
 
             except (PlaywrightError, PlaywrightTimeoutError, ValueError) as e:
                 last_err = e
                 continue
             else:
-                return loc
+                return loc, cand
 
         # If we reach here no candidate matched — build a helpful diagnostic
         sel_list = [c.selector for c in selset.candidates]
         msg = f"None of the candidates matched: {sel_list} | last_error={last_err}"
         raise RuntimeError(msg)
 
+    def inner_texts(self, root: Locator, selset: SelectorSet) -> list[str]:
+        """
+        Return the innerText of every element under ``root`` matching ``selset``.
+
+        Candidates are resolved as in :meth:`locate`, so validation and each
+        candidate's ``state``/``timeout_ms`` apply. When the matching
+        candidate is CSS the texts are collected with one in-page
+        ``evaluate`` on the first ``root`` element; XPath, Playwright-only
+        selector syntax, or an empty result use ``all_inner_texts``.
+        """
+        loc, cand = self._match(root, selset)
+        if cand.engine == "css":
+            with contextlib.suppress(PlaywrightError):
+                texts = root.first.evaluate(_INNER_TEXTS_JS, cand.selector)
+                if texts:
+                    return texts
+        return loc.all_inner_texts()
+
+    def wait_any(
+        self,
+        root: Locator | Page,
+        selset: SelectorSet,
+        timeout_ms: float,
+        state: str = "attached",
+    ) -> bool:
+        """
+        Wait until any candidate of ``selset`` reaches ``state``.
+
+        All valid candidates are combined with ``Locator.or_`` so Playwright
+        waits for whichever appears first in a single event-driven wait.
+        Returns False on timeout instead of raising.
+        """
+        cands = [
+            c
+            for c in selset.candidates
+            if c.allow_unstable or not _UNSTABLE_RE.search(c.selector)
+        ]
+        if not cands:
+            return False
+        loc = self._loc(root, cands[0])
+        for cand in cands[1:]:
+            loc = loc.or_(self._loc(root, cand))
+        try:
+            loc.first.wait_for(state=state, timeout=timeout_ms)
+        except (PlaywrightError, PlaywrightTimeoutError):
+            return False
+        return True
+
     def maybe(self, root: Locator | Page, selset: SelectorSet) -> Locator | None:
         try:
             return self.locate(root, selset)
@@ -166,9 +287,7 @@ class SelectorResolver:
             return None
 
     def _loc(self, root: Locator | Page, cand: SelectorCandidate) -> Locator:
-        if cand.engine == "css":
-            return root.locator(cand.selector)
-        return root.locator(f"xpath={cand.selector}")
+        return root.locator(cand.locator_arg)
 
 
 # ----------------------------
@@ -208,6 +327,9 @@ class MsSsoAuth(AuthStrategy):
         self.username = username
         self.password = password
         self.timeout_s = timeout_s
+        self._compiled: dict[str, SelectorSet | None] = {}
+        # The config itself, not id(cfg): ids are reused once a config is freed
+        self._compiled_cfg: Config | None = None
 
     """Automated Microsoft SSO authentication strategy.
 
@@ -219,86 +341,99 @@ class MsSsoAuth(AuthStrategy):
     """
 
     def _on_ms_host(self, page: Page) -> bool:
-        u = page.url or ""
-        return any(
-            h in u
-            for h in (
-                "login.microsoftonline.com",
-                "login.live.com",
-                "login.microsoft.com",
-            )
-        )
+        return is_ms_login(page.url)
+
+    def _compile(self, cfg: Config) -> dict[str, SelectorSet | None]:
+        """Build (once per ``cfg``) the SelectorSets used by the MS flow."""
+        if self._compiled_cfg is not cfg:
+
+            def mk(ss: dict | None) -> SelectorSet | None:
+                if not ss:
+                    return None
+                return SelectorSet([_cand(c) for c in ss["candidates"]])
+
+            sel = cfg.selectors
+            self._compiled = {
+                "email": mk(sel.get("ms_email")),
+                "next": mk(sel.get("ms_next")),
+                "password": mk(sel.get("ms_password")),
+                "signin": mk(sel.get("ms_signin")),
+                "app_signin": mk(sel.get("ms_app_signin") or sel.get("ms_signin")),
+            }
+            self._compiled_cfg = cfg
+        return self._compiled
 
     def _trigger_app_signin(
         self,
         page: Page,
-        cfg: Config,
         resolver: SelectorResolver,
-        mk: Callable[[dict], SelectorSet],
+        sets: dict[str, SelectorSet | None],
     ) -> None:
         # Try clicking an app signin control (if configured) to start the redirect
-        app_signin = cfg.selectors.get("ms_app_signin") or cfg.selectors.get(
-            "ms_signin",
-        )
+        app_signin = sets["app_signin"]
+        if app_signin is None:
+            return
         # Only suppress Playwright/browser related errors here so we don't hide other bugs
         with contextlib.suppress(PlaywrightError, PlaywrightTimeoutError):
-            resolver.locate(page, mk(app_signin)).click()
+            resolver.locate(page, app_signin).click()
 
     def _wait_for_ms_host(self, page: Page, _cfg: Config, max_wait: float) -> bool:
-        deadline = monotonic() + max_wait
-        while monotonic() < deadline:
-            if self._on_ms_host(page):
-                return True
-            page.wait_for_timeout(250)
-        return False
+        if self._on_ms_host(page):
+            return True
+        # Event-driven: resolves on the navigation itself, no polling sleeps.
+        # "commit" returns as soon as the IdP response starts arriving.
+        try:
+            page.wait_for_url(
+                is_ms_login,
+                timeout=max_wait * 1000,
+                wait_until="commit",
+            )
+        except (PlaywrightError, PlaywrightTimeoutError):
+            return False
+        return True
 
     def _fill_and_submit(
         self,
         page: Page,
-        cfg: Config,
         resolver: SelectorResolver,
-        mk: Callable[[dict], SelectorSet],
-        left: Callable[[], float],
+        sets: dict[str, SelectorSet | None],
+        deadline: float,
     ) -> None:
-        # Fill email -> next -> password -> signin
-        resolver.locate(page, mk(cfg.selectors.get("ms_email"))).fill(self.username)
-        resolver.locate(page, mk(cfg.selectors.get("ms_next"))).click()
-        resolver.locate(page, mk(cfg.selectors.get("ms_password"))).fill(self.password)
-        resolver.locate(page, mk(cfg.selectors.get("ms_signin"))).click()
+        # Fill email -> next -> password -> signin. locate() waits for each
+        # control and fill/click auto-wait for actionability, so no sleeps.
+        resolver.locate(page, sets["email"]).fill(self.username)
+        resolver.locate(page, sets["next"]).click()
+        resolver.locate(page, sets["password"]).fill(self.password)
+        resolver.locate(page, sets["signin"]).click()
 
         # wait until page leaves MS host
-        while left() > 0:
-            if not self._on_ms_host(page):
-                break
-            page.wait_for_timeout(250)
+        remaining = deadline - monotonic()
+        if remaining > 0 and self._on_ms_host(page):
+            with contextlib.suppress(PlaywrightTimeoutError):
+                page.wait_for_url(
+                    lambda url: not is_ms_login(url),
+                    timeout=remaining * 1000,
+                    wait_until="commit",
+                )
 
     def login(self, page: Page, cfg: Config, resolver: SelectorResolver) -> None:
         if not (self.username and self.password):
             return
         # selectors expected for MS flow
-        email = cfg.selectors.get("ms_email")
-        next_btn = cfg.selectors.get("ms_next")
-        pwd = cfg.selectors.get("ms_password")
-        signin = cfg.selectors.get("ms_signin")
-        if not all([email, next_btn, pwd, signin]):
+        sets = self._compile(cfg)
+        if not all(sets[k] for k in ("email", "next", "password", "signin")):
             logger.debug(
                 "MsSsoAuth.login: MS selector set incomplete, skipping automated login",
             )
             return
 
-        def mk(ss: dict) -> SelectorSet:
-            return SelectorSet([SelectorCandidate(**c) for c in ss["candidates"]])
-
         deadline = monotonic() + self.timeout_s
 
-        def left() -> float:
-            return max(0.0, deadline - monotonic())
-
         # If we're not on the MS-host yet, try to trigger the redirect from the app page
         if not self._on_ms_host(page):
             # try clicking the app sign-in control (suppress errors)
             try:
-                self._trigger_app_signin(page, cfg, resolver, mk)
+                self._trigger_app_signin(page, resolver, sets)
             except (PlaywrightError, PlaywrightTimeoutError):
                 # keep going — the helper already suppresses expected exceptions
                 logger.exception(
@@ -328,7 +463,7 @@ class MsSsoAuth(AuthStrategy):
 
         # Now on MS host — attempt form fill/submit
         try:
-            self._fill_and_submit(page, cfg, resolver, mk, left)
+            self._fill_and_submit(page, resolver, sets, deadline)
         except (PlaywrightError, PlaywrightTimeoutError):
             logger.exception("MsSsoAuth.login: exception during MS form fill/submit")
 
@@ -344,8 +479,12 @@ class Paginator:
 
     Subclasses implement ``next_page`` returning True when navigation to a
     next page was issued and False when no further pages are available.
+    ``replaces_rows`` tells the scraper whether advancing swaps the visible
+    rows (so it must wait for the old ones to go) or appends to them.
     """
 
+    replaces_rows: ClassVar[bool] = True
+
     def next_page(self) -> bool:  # pragma: no cover
         """
         Advance to the next page.
@@ -367,11 +506,13 @@ class NextButtonPaginator(Paginator):
         self.resolver = resolver
         button = btn_cfg.get("button") or {"candidates": []}
         self.btn_set = SelectorSet(
-            [SelectorCandidate(**c) for c in button["candidates"]],
+            [_cand(c) for c in button["candidates"]],
         )
-        self.disabled_checks = btn_cfg.get(
-            "disabled_checks",
-            ["aria_disabled", "property_disabled"],
+        self.disabled_checks = frozenset(
+            btn_cfg.get(
+                "disabled_checks",
+                ["aria_disabled", "property_disabled"],
+            ),
         )
 
     """Paginator that clicks a "Next" or paging control.
@@ -389,13 +530,19 @@ class NextButtonPaginator(Paginator):
 
         btn = btn_loc.first
         try:
-            if "property_disabled" in self.disabled_checks and btn.evaluate(
-                "el => !!el.disabled",
-            ):
-                return False
-            if "aria_disabled" in self.disabled_checks:
-                aria = btn.get_attribute("aria-disabled")
-                if aria and aria.lower() == "true":
+            if self.disabled_checks:
+                # Read both disabled signals in a single round-trip
+                state = btn.evaluate(
+                    "el => ({d: !!el.disabled, a: el.getAttribute('aria-disabled')})",
+                )
+                if "property_disabled" in self.disabled_checks and state["d"]:
+                    return False
+                aria = state["a"]
+                if (
+                    "aria_disabled" in self.disabled_checks
+                    and aria
+                    and aria.lower() == "true"
+                ):
                     return False
             btn.click()
             return True
@@ -405,6 +552,8 @@ class NextButtonPaginator(Paginator):
 
 
 class LoadMorePaginator(Paginator):
+    replaces_rows: ClassVar[bool] = False
+
     def __init__(
         self,
         root: Locator | Page,
@@ -415,7 +564,7 @@ class LoadMorePaginator(Paginator):
         self.resolver = resolver
         self.btn_set = SelectorSet(
             [
-                SelectorCandidate(**c)
+                _cand(c)
                 for c in (cfg.get("button") or {"candidates": []})["candidates"]
             ],
         )
@@ -448,7 +597,7 @@ class NumberedPaginator(Paginator):
         self.resolver = resolver
         container = cfg.get("container") or {"candidates": []}
         self.container_set = SelectorSet(
-            [SelectorCandidate(**c) for c in container["candidates"]],
+            [_cand(c) for c in container["candidates"]],
         )
         self.pattern = cfg.get("next_page_pattern", "a[aria-label='Page {n}']")
         self.n = cfg.get("start_from", 2)
@@ -475,6 +624,8 @@ class NumberedPaginator(Paginator):
 
 
 class InfiniteScrollPaginator(Paginator):
+    replaces_rows: ClassVar[bool] = False
+
     def __init__(self, root: Locator | Page, cfg: dict) -> None:
         self.root = root
         self.scroll_step = int(cfg.get("scroll_step_px", 1200))
@@ -529,21 +680,21 @@ class GenericExtractor:
 
         sel = cfg.selectors
         self.table_container = SelectorSet(
-            [SelectorCandidate(**c) for c in sel["table_container"]["candidates"]],
+            [_cand(c) for c in sel["table_container"]["candidates"]],
         )
 
         hdr_cfg = sel.get("header_cells")
         self.header_cells = (
-            SelectorSet([SelectorCandidate(**c) for c in hdr_cfg["candidates"]])
+            SelectorSet([_cand(c) for c in hdr_cfg["candidates"]])
             if hdr_cfg
             else None
         )
 
         self.row = SelectorSet(
-            [SelectorCandidate(**c) for c in sel["row"]["candidates"]],
+            [_cand(c) for c in sel["row"]["candidates"]],
         )
         self.cell = SelectorSet(
-            [SelectorCandidate(**c) for c in sel["cell"]["candidates"]],
+            [_cand(c) for c in sel["cell"]["candidates"]],
         )
 
     def read_page(self) -> tuple[list[str] | None, list[list[str]]]:
@@ -560,8 +711,7 @@ class GenericExtractor:
         headers: list[str] | None = None
         if self.header_cells:
             try:
-                header_loc = self.r.locate(container, self.header_cells)
-                header_texts = header_loc.all_inner_texts()
+                header_texts = self.r.inner_texts(container, self.header_cells)
                 headers = [self._norm(t) for t in header_texts if t is not None]
                 if all(not h for h in headers):
                     headers = None
@@ -579,12 +729,7 @@ class GenericExtractor:
             if not cell_cands:
                 texts = []
             else:
-                first = cell_cands[0]
-                cells_loc = (
-                    r.locator(first.selector)
-                    if first.engine == "css"
-                    else r.locator(f"xpath={first.selector}")
-                )
+                cells_loc = r.locator(cell_cands[0].locator_arg)
                 texts = cells_loc.all_inner_texts()
             rows.append([self._norm(t) for t in texts])
 
@@ -618,12 +763,32 @@ class GenericScraper:
     - prepare the page (frames, waits, hide spinners)
     - paginate and extract rows
     - convert results to :class:`pandas.DataFrame`.
+
+    When ``reuse_browser`` is True the Playwright driver and browser are
+    taken from a class-level pool keyed on ``(thread, browser, headless)``
+    so repeated scrapers only pay for a fresh context and page. Pooled
+    browsers survive :meth:`close`; call :meth:`shutdown_all` at process
+    exit to stop them.
     """
 
-    def __init__(self, cfg: Config, auth: AuthStrategy | None = None) -> None:
+    # Pooled (playwright, browser) pairs shared by reuse_browser scrapers
+    _browser_cache: ClassVar[dict[tuple, tuple[Any, Any]]] = {}
+    # Upper bound on parallel_pages: each worker runs its own driver and browser
+    MAX_PAGE_WORKERS: ClassVar[int] = 4
+
+    def __init__(
+        self,
+        cfg: Config,
+        auth: AuthStrategy | None = None,
+        reuse_browser: bool = False,
+    ) -> None:
         self.cfg = cfg
         self.auth = auth
-        self._play = sync_playwright().start()
+        self._pre_actions = _compile_pre_actions(cfg.pre_actions or [])
+        self._reuse_browser = reuse_browser
+        self._closed = False
+        # (frames key, page url, root) memo for _enter_frames
+        self._frames_root: tuple[tuple, str, Locator | Page] | None = None
 
         # Determine whether a saved storage state exists so we can optionally
         # force a headed (visible) browser on the first run when requested.
@@ -638,19 +803,61 @@ class GenericScraper:
                 "GenericScraper: no session found and headed_on_first_run=True,",
             )
 
-        browser_type = getattr(self._play, cfg.browser)
-        browser = browser_type.launch(headless=headless_effective)
+        self._play, browser = self._launch(cfg.browser, headless_effective)
 
         self.context, self._state_reused = load_context(browser, cfg)
 
         self.page: Page = self.context.new_page()
 
+    def _launch(self, browser_name: str, headless: bool) -> tuple[Any, Any]:
+        """Return ``(playwright, browser)``, from the pool when enabled."""
+        # Playwright's sync API is bound to the thread that started it
+        key = (threading.get_ident(), browser_name, headless)
+        if self._reuse_browser:
+            cached = GenericScraper._browser_cache.get(key)
+            if cached is not None:
+                if cached[1].is_connected():
+                    return cached
+                # Browser went away; drop the stale driver and relaunch
+                del GenericScraper._browser_cache[key]
+                with contextlib.suppress(PlaywrightError):
+                    cached[0].stop()
+
+        play = sync_playwright().start()
+        browser = getattr(play, browser_name).launch(headless=headless)
+        if self._reuse_browser:
+            GenericScraper._browser_cache[key] = (play, browser)
+        return play, browser
+
     def close(self) -> None:
-        """Shut down Playwright browser context and stop the driver."""
+        """
+        Shut down the Playwright browser context and stop the driver.
+
+        Pooled browsers (``reuse_browser=True``) are left running; see
+        :meth:`shutdown_all`.
+
+        Idempotent: later calls return without touching the browser.
+        """
+        if self._closed:
+            return
         try:
             self.context.close()
         finally:
-            self._play.stop()
+            # Even when context.close() raised, the context is unusable; a
+            # retry would only repeat the failing round-trip
+            self._closed = True
+            if not self._reuse_browser:
+                self._play.stop()
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Close every pooled browser and stop its Playwright driver."""
+        while cls._browser_cache:
+            _, (play, browser) = cls._browser_cache.popitem()
+            with contextlib.suppress(PlaywrightError):
+                browser.close()
+            with contextlib.suppress(PlaywrightError):
+                play.stop()
 
     def _ensure_authenticated(self) -> None:
         """
@@ -671,11 +878,8 @@ class GenericScraper:
         # authentication flows or reveal content). Actions are small and simple
         # to keep configs expressive and avoid embedding site-specific clicks
         # inside auth strategy implementations.
-        for act in self.cfg.pre_actions or []:
+        for a, sel, selset, val, pause_ms in self._pre_actions:
             try:
-                a = act.get("action")
-                sel = act.get("selector")
-                val = act.get("value")
                 if a == "navigate":
                     target = val or sel or self.cfg.base_url
                     self.page.goto(
@@ -683,14 +887,8 @@ class GenericScraper:
                         wait_until="domcontentloaded",
                     )
                     continue
-                if not sel:
+                if selset is None:
                     continue
-                selset = SelectorSet(
-                    [
-                        SelectorCandidate(**c)
-                        for c in {"candidates": [{"selector": sel}]}.get("candidates")
-                    ],
-                )
                 loc = resolver.maybe(self.page, selset)
                 if loc is None:
                     continue
@@ -711,8 +909,9 @@ class GenericScraper:
                         # fallback to click+fill for custom controls
                         loc.click()
                         loc.fill(str(val))
-                # small pause between actions
-                self.page.wait_for_timeout(int(act.get("pause_ms", 150)))
+                # optional pause between actions (actions themselves auto-wait)
+                if pause_ms > 0:
+                    self.page.wait_for_timeout(pause_ms)
             except (
                 PlaywrightError,
                 PlaywrightTimeoutError,
@@ -729,14 +928,11 @@ class GenericScraper:
             if self.auth:
                 self.auth.login(self.page, self.cfg, resolver)
 
-            # wait for post-login condition
-            wait_until(
+            # wait for post-login condition; save successful state for next run
+            if wait_until(
                 lambda: is_logged_in(self.page, self.cfg),
                 self.cfg.session.auth_timeout_s,
-            )
-
-            # save successful state for next run
-            if is_logged_in(self.page, self.cfg):
+            ):
                 save_context(self.context, self.cfg)
 
     def _enter_frames(self) -> Locator | Page:
@@ -745,16 +941,33 @@ class GenericScraper:
 
         The function iterates over configured frames and updates the root
         locator to the matching frame locator. If no frames are configured
-        the page is returned (top-level context).
+        the page is returned (top-level context). The resolved root is
+        memoized and reused until the page navigates to another URL.
         """
-        root: Locator | Page = self.page
-        for f in self.cfg.frames or []:
-            if s := f.get("url_substring"):
-                fl = self.page.frame_locator(f"iframe[src*='{s}']")
+        frames = self.cfg.frames or []
+        if not frames:
+            return self.page
+        key = tuple((f.get("url_substring"), f.get("selector")) for f in frames)
+        url = self.page.url
+        cached = self._frames_root
+        if cached is not None and cached[0] == key and cached[1] == url:
+            return cached[2]
+
+        root = self._frame_root(self.page, key)
+        self._frames_root = (key, url, root)
+        return root
+
+    @staticmethod
+    def _frame_root(page: Page, key: tuple) -> Locator | Page:
+        """Walk ``(url_substring, selector)`` frame entries down from ``page``."""
+        root: Locator | Page = page
+        for s, cand in key:
+            if s:
+                fl = page.frame_locator(f"iframe[src*='{s}']")
                 fl.first.wait_for()
                 root = fl.first
-            elif cand := f.get("selector"):
-                fl = self.page.frame_locator(cand)
+            elif cand:
+                fl = page.frame_locator(cand)
                 fl.first.wait_for()
                 root = fl.first
         return root
@@ -770,7 +983,7 @@ class GenericScraper:
         # Wait until any of the wait_targets resolves
         for target in self.cfg.wait_targets or []:
             try:
-                sel = SelectorSet([SelectorCandidate(**target)])
+                sel = SelectorSet([_cand(target)])
                 resolver.locate(root, sel)
                 break
             except (PlaywrightError, PlaywrightTimeoutError, ValueError):
@@ -778,7 +991,7 @@ class GenericScraper:
         # Hide/await spinners/overlays if provided
         for sp in self.cfg.spinners_to_hide or []:
             try:
-                sel = SelectorSet([SelectorCandidate(**sp)])
+                sel = SelectorSet([_cand(sp)])
                 resolver.locate(root, sel)  # e.g., state: hidden
             except (PlaywrightError, PlaywrightTimeoutError, ValueError):
                 pass
@@ -799,7 +1012,7 @@ class GenericScraper:
             control = resolver.locate(
                 root,
                 SelectorSet(
-                    [SelectorCandidate(**c) for c in control_cfg["candidates"]],
+                    [_cand(c) for c in control_cfg["candidates"]],
                 ),
             )
             tag = (
@@ -867,7 +1080,6 @@ class GenericScraper:
         # a brief moment before the expected table container appears. Allow a
         # short configurable wait and one navigate retry to reduce flakiness in
         # integration tests and real runs.
-        table_found = False
         try:
             wait_for_table_s = int(
                 self.cfg.data_normalization.get("wait_for_table_s", 3) or 3,
@@ -875,12 +1087,12 @@ class GenericScraper:
         except (TypeError, ValueError):
             wait_for_table_s = 3
 
-        deadline = monotonic() + wait_for_table_s
-        while monotonic() < deadline:
-            if resolver.maybe(root, extractor.table_container) is not None:
-                table_found = True
-                break
-            self.page.wait_for_timeout(250)
+        # Event-driven wait inside Playwright rather than Python-side polling
+        table_found = resolver.wait_any(
+            root,
+            extractor.table_container,
+            wait_for_table_s * 1000,
+        )
 
         if not table_found:
             # Try navigating to the configured base_url once and retry briefly.
@@ -888,12 +1100,7 @@ class GenericScraper:
             with contextlib.suppress(PlaywrightError, PlaywrightTimeoutError):
                 self.page.goto(self.cfg.base_url, wait_until="domcontentloaded")
 
-            deadline2 = monotonic() + 2.0
-            while monotonic() < deadline2:
-                if resolver.maybe(root, extractor.table_container) is not None:
-                    table_found = True
-                    break
-                self.page.wait_for_timeout(200)
+            table_found = resolver.wait_any(root, extractor.table_container, 2000)
 
         if not table_found:
             # Provide a clearer diagnostic to help tests and developers debug
@@ -917,59 +1124,379 @@ class GenericScraper:
         max_pages = int(self.cfg.data_normalization.get("max_pages", 0) or 0)
         max_rows = int(self.cfg.data_normalization.get("max_rows", 0) or 0)
         dedupe = bool(self.cfg.data_normalization.get("dedupe_rows", True))
-        seen = set()
+        seen: set[str] = set()
+        max_len = 0
+        # Without a row cap nothing depends on the running count, so dedupe
+        # once over the whole batch in pandas instead of per row
+        pd = _pandas() if dedupe and not max_rows else None
+        batch_dedupe = pd is not None
+
+        workers = self._page_workers()
+        template = self.cfg.data_normalization.get("page_url_template")
+        if workers > 1 and template:
+            pages = self._read_pages_parallel(
+                resolver,
+                extractor,
+                paginator,
+                template,
+                workers,
+                max_pages,
+            )
+        else:
+            pages = self._read_pages(extractor, paginator)
+
+        # Bound methods in locals: skips the attribute lookups per row
+        append_row = all_rows.append
+        seen_contains = seen.__contains__
+        seen_add = seen.add
+        # Share one str object per distinct cell value; scraped tables repeat
+        # statuses/categories heavily, so this cuts the frame's memory
+        interned: dict[str, str] = {}
+        intern_cell = interned.setdefault
 
         page_i = 0
-        while True:
-            page_i += 1
-            h, rows = extractor.read_page()
-            if header is None and h:
-                header = h
-
-            for r in rows:
-                tup = tuple(r)
-                if dedupe:
-                    if tup in seen:
-                        continue
-                    seen.add(tup)
-                all_rows.append(r)
-                if max_rows and len(all_rows) >= max_rows:
+        # Close the reader when stopping early so parallel page workers
+        # are told to stop instead of finishing their whole range
+        with contextlib.closing(pages):
+            for h, rows in pages:
+                page_i += 1
+                if header is None and h:
+                    header = h
+
+                for r in rows:
+                    if dedupe and not batch_dedupe:
+                        # One joined string per row: cheaper to build and hash
+                        # than a tuple, and only computed when deduping
+                        key = _ROW_SEP.join(r)
+                        if seen_contains(key):
+                            continue
+                        seen_add(key)
+                    append_row([intern_cell(c, c) for c in r])
+                    if len(r) > max_len:
+                        max_len = len(r)
+                    if max_rows and len(all_rows) >= max_rows:
+                        break
+
+                if (max_pages and page_i >= max_pages) or (
+                    max_rows and len(all_rows) >= max_rows
+                ):
                     break
 
-            if (max_pages and page_i >= max_pages) or (
-                max_rows and len(all_rows) >= max_rows
-            ):
-                break
+        if batch_dedupe and all_rows:
+            keep = ~pd.Index([_ROW_SEP.join(r) for r in all_rows]).duplicated()
+            if not keep.all():
+                all_rows = [all_rows[i] for i in keep.nonzero()[0]]
+
+        dframe = self._to_dataframe(all_rows, header, max_len)
+        dframe.attrs["page_count"] = page_i
+        return dframe
 
+    def _page_workers(self) -> int:
+        """Return the configured ``parallel_pages`` worker count, 0 if unusable."""
+        try:
+            workers = int(self.cfg.data_normalization.get("parallel_pages", 0) or 0)
+        except (TypeError, ValueError):
+            return 0
+        if workers > 1 and (self.cfg.rows_per_page or {}).get("control"):
+            # The page size is set through the UI on this page only; worker
+            # pages opened from the URL template would come back at the
+            # site's default size (and page count) and rows would be lost
+            logger.info(
+                "parallel_pages ignored: rows_per_page is configured, "
+                "reading pages sequentially",
+            )
+            return 0
+        return workers
+
+    def _read_pages(
+        self,
+        extractor: GenericExtractor,
+        paginator: Paginator,
+    ) -> Iterator[tuple[list[str] | None, list[list[str]]]]:
+        """Yield ``(header, rows)`` per page, advancing with ``paginator``."""
+        while True:
+            yield extractor.read_page()
+
+            if not self._advance(extractor, paginator):
+                return
+
+    def _advance(self, extractor: GenericExtractor, paginator: Paginator) -> bool:
+        """
+        Advance ``paginator`` and wait for the next page's rows.
+
+        For paginators that replace the rows in place (XHR "Next" buttons,
+        numbered links) the first row is marked before advancing, so the
+        wait can tell the new page from the old one still on screen.
+        Returns False when there is no next page.
+        """
+        marker = self._first_row(extractor) if paginator.replaces_rows else None
+        try:
             if not paginator.next_page():
-                break
+                return False
+            self._wait_next_page(extractor, marker)
+        finally:
+            if marker is not None:
+                with contextlib.suppress(PlaywrightError):
+                    marker[0].dispose()
+        return True
 
-            # Small pause to allow DOM to update between pages
-            self.page.wait_for_timeout(250)
+    @staticmethod
+    def _first_row(extractor: GenericExtractor) -> tuple[Any, str] | None:
+        """Return ``(handle, innerText)`` of the current first row, or None."""
+        if not extractor.row.candidates:
+            return None
+        container = extractor.r.maybe(extractor.root, extractor.table_container)
+        if container is None:
+            return None
+        rows = extractor.r.maybe(container, extractor.row)
+        if rows is None:
+            return None
+        try:
+            handle = rows.first.element_handle(timeout=1000)
+            return handle, handle.evaluate("el => el.innerText")
+        except (PlaywrightError, PlaywrightTimeoutError):
+            return None
 
-        dframe = self._to_dataframe(all_rows, header)
-        dframe.attrs["page_count"] = page_i
-        return dframe
+    def _wait_next_page(
+        self,
+        extractor: GenericExtractor,
+        marker: tuple[Any, str] | None = None,
+    ) -> None:
+        """
+        Wait until the next page's rows are in place after advancing.
+
+        With a ``marker`` from :meth:`_first_row`, first waits for that row
+        to detach or change its text: AJAX pagers leave the previous rows
+        attached until the response lands, and reading them again would
+        skip a page. Then returns as soon as a ``row`` candidate is present
+        under the table container. Falls back to the old 250 ms pause when
+        the page never visibly changes, no row selector is configured, or
+        the rows do not appear.
+        """
+        if marker is not None:
+            handle, text = marker
+            frame = handle.owner_frame()
+            try:
+                if frame is not None:
+                    frame.wait_for_function(
+                        _ROW_CHANGED_JS,
+                        arg=[handle, text],
+                        timeout=5000,
+                    )
+            except PlaywrightTimeoutError:
+                self.page.wait_for_timeout(250)
+                return
+            except PlaywrightError:
+                # Execution context destroyed: a full navigation replaced
+                # the page, which is the change being waited for
+                pass
+        if extractor.row.candidates:
+            container = extractor.r.maybe(extractor.root, extractor.table_container)
+            if container is not None and extractor.r.wait_any(
+                container,
+                extractor.row,
+                5000,
+            ):
+                return
+        self.page.wait_for_timeout(250)
+
+    def _total_pages(self, resolver: SelectorResolver, root: Locator | Page) -> int:
+        """
+        Return the total page count advertised by the page, or 0 if unknown.
+
+        Reads the ``page_count`` selector set (e.g. a "Page 1 of 12" label)
+        and takes the last integer in its text.
+        """
+        cfg = self.cfg.selectors.get("page_count")
+        if not cfg:
+            return 0
+        loc = resolver.maybe(root, SelectorSet([_cand(c) for c in cfg["candidates"]]))
+        if loc is None:
+            return 0
+        try:
+            text = loc.first.inner_text()
+        except (PlaywrightError, PlaywrightTimeoutError):
+            return 0
+        m = _LAST_INT_RE.search(text or "")
+        return int(m.group(1)) if m else 0
+
+    def _read_pages_parallel(
+        self,
+        resolver: SelectorResolver,
+        extractor: GenericExtractor,
+        paginator: Paginator,
+        template: str,
+        workers: int,
+        max_pages: int,
+    ) -> Iterator[tuple[list[str] | None, list[list[str]]]]:
+        """
+        Yield ``(header, rows)`` per page, fetching pages 2..N concurrently.
+
+        The first page is read from the current page. The remaining page
+        numbers are split into contiguous ranges, one per worker; each
+        worker opens its own browser seeded with this context's storage
+        state and navigates to ``template.format(n=k)``. Results are yielded
+        in page order. When the page count is unknown (no ``page_count``
+        selector and no ``max_pages``) the sequential paginator is used.
+
+        At most :attr:`MAX_PAGE_WORKERS` browsers run at once. A page a
+        worker could not read is re-read on this scraper's own page rather
+        than failing the run, and closing the generator early stops the
+        workers after their current page.
+        """
+        yield extractor.read_page()
+
+        total = self._total_pages(resolver, extractor.root)
+        if max_pages:
+            total = min(total, max_pages) if total else max_pages
+        if not total:
+            # Unknown page count: continue sequentially from page 1
+            if self._advance(extractor, paginator):
+                yield from self._read_pages(extractor, paginator)
+            return
+        if total < 2:
+            return
+
+        page_nums = list(range(2, total + 1))
+        cap = min(workers, len(page_nums), self.MAX_PAGE_WORKERS)
+        if cap < workers:
+            logger.info("parallel_pages=%d capped to %d workers", workers, cap)
+        size = -(-len(page_nums) // cap)  # ceil division
+        shards = [page_nums[i : i + size] for i in range(0, len(page_nums), size)]
+        storage_state = self.context.storage_state()
+        frames_key = tuple(
+            (f.get("url_substring"), f.get("selector")) for f in self.cfg.frames or []
+        )
+
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=len(shards))
+        try:
+            futures = [
+                pool.submit(
+                    self._scrape_page_range,
+                    shard,
+                    template,
+                    storage_state,
+                    idx * 0.1,  # stagger worker start to avoid bursts
+                    frames_key,
+                    stop,
+                )
+                for idx, shard in enumerate(shards)
+            ]
+            for shard, fut in zip(shards, futures):
+                done = fut.result()
+                for n in shard:
+                    if n in done:
+                        yield done[n]
+                    else:
+                        # The worker logged why; read this page here instead
+                        # of failing the pages other workers already have
+                        yield self._read_page_at(
+                            self.page,
+                            resolver,
+                            template.format(n=n),
+                            frames_key,
+                        )
+        finally:
+            # Reached early when the caller stops consuming (max_rows): drop
+            # queued shards and let running workers finish their current page
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _read_page_at(
+        self,
+        page: Page,
+        resolver: SelectorResolver,
+        url: str,
+        frames_key: tuple,
+    ) -> tuple[list[str] | None, list[list[str]]]:
+        """Navigate ``page`` to ``url`` and read the table found there."""
+        page.goto(url, wait_until="domcontentloaded")
+        root = self._frame_root(page, frames_key)
+        self._wait_ready(resolver, root)
+        return GenericExtractor(resolver, self.cfg, root).read_page()
+
+    def _scrape_page_range(
+        self,
+        page_nums: list[int],
+        template: str,
+        storage_state: dict,
+        delay_s: float,
+        frames_key: tuple,
+        stop: threading.Event,
+    ) -> dict[int, tuple[list[str] | None, list[list[str]]]]:
+        """
+        Read ``page_nums`` in a dedicated browser (runs in a worker thread).
+
+        Playwright's sync API is bound to the thread that started it, so
+        each worker starts and stops its own driver. Returns the pages read
+        keyed by page number; failed pages are logged and left out for the
+        caller to retry. Stops between pages once ``stop`` is set.
+        """
+        results: dict[int, tuple[list[str] | None, list[list[str]]]] = {}
+        if delay_s and stop.wait(delay_s):
+            return results
+        play = None
+        try:
+            play = sync_playwright().start()
+            browser = getattr(play, self.cfg.browser).launch(headless=self.cfg.headless)
+            context = browser.new_context(storage_state=storage_state)
+            page = context.new_page()
+            resolver = SelectorResolver(page)
+            for n in page_nums:
+                if stop.is_set():
+                    break
+                try:
+                    results[n] = self._read_page_at(
+                        page,
+                        resolver,
+                        template.format(n=n),
+                        frames_key,
+                    )
+                except (PlaywrightError, RuntimeError, ValueError) as e:
+                    logger.warning("Parallel read of page %d failed: %s", n, e)
+        except PlaywrightError as e:
+            logger.warning("Page worker for pages %s failed: %s", page_nums, e)
+        finally:
+            if play is not None:
+                play.stop()
+        return results
 
     @staticmethod
-    def _to_dataframe(rows: list[list[str]], header: list[str] | None) -> pd.DataFrame:
-        # Use top-level `pd` imported earlier; raise a clear error if missing.
+    def _to_dataframe(
+        rows: list[list[str]],
+        header: list[str] | None,
+        max_len: int | None = None,
+    ) -> pd.DataFrame:
+        pd = _pandas()
         if pd is None:
             raise RuntimeError(
                 "pandas is required to convert scraped rows to a DataFrame: install pandas",
             )
+        import numpy as np  # a pandas dependency, already loaded by now
 
         if not rows:
             return pd.DataFrame()
-        max_len = max(len(r) for r in rows)
-        norm = [
-            r + [""] * (max_len - len(r)) if len(r) < max_len else r[:max_len]
-            for r in rows
-        ]
+        if max_len is None:
+            max_len = max(len(r) for r in rows)
+        # Fill one pre-padded object array instead of padding each row list.
+        # Fortran order matches pandas' column-major block layout, so the
+        # DataFrame can wrap the array without a transpose copy. (A dict of
+        # per-column arrays would be re-consolidated into one block, i.e.
+        # copied, and would silently merge duplicate header names.)
+        if all(len(r) == max_len for r in rows):
+            # Common case: no padding needed, copy every row in one C-level pass
+            arr = np.empty((len(rows), max_len), dtype=object, order="F")
+            arr[:] = rows
+        else:
+            arr = np.full((len(rows), max_len), "", dtype=object, order="F")
+            for i, r in enumerate(rows):
+                arr[i, : len(r)] = r
         if header and len(header) == max_len:
             cols = [c if c else f"col_{i}" for i, c in enumerate(header)]
-            return pd.DataFrame(norm, columns=cols)
-        return pd.DataFrame(norm, columns=[f"col_{i}" for i in range(max_len)])
+        else:
+            cols = [f"col_{i}" for i in range(max_len)]
+        return pd.DataFrame(arr, columns=cols, copy=False)
 
 
 # ----------------------------
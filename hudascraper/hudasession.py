@@ -23,6 +23,7 @@ import contextlib
 import json
 import logging
 import os
+import re
 import tempfile
 import time
 from collections.abc import Callable
@@ -33,23 +34,38 @@ from playwright.sync_api import Error as PlaywrightError
 
 from .hudasconfig import Config
 
+try:
+    import orjson
+except ImportError:  # optional: faster storage_state serialization
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# fdatasync is POSIX-only; fall back to fsync elsewhere
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# First (shortest) polling delay used by wait_until's backoff
+_MIN_POLL_S = 0.025
+
+# Microsoft identity provider hosts (login.microsoftonline.com and friends)
+_MS_LOGIN_RE = re.compile(r"login\.(?:microsoftonline|live|microsoft)\.com")
+
 
 def _state_file(cfg: Config) -> Path:
     """
     Return the path where storage_state for ``cfg`` should be stored.
 
-    If ``cfg.session.path`` is provided it is returned verbatim. Otherwise
+    If ``cfg.session.path`` is provided it is returned as a Path. Otherwise
     a canonical location under the user's home directory is used. The
     filename is ``{user or 'default'}.json`` and the file is placed under
     ``~/.scraper/sessions/{site_host}/``.
     """
-    if cfg.session.path:
-        return cfg.session.path
+    s = cfg.session
+    if s.path:
+        return Path(s.path)
+    # Resolved per call (it is cheap) so a changed HOME is always honoured
     base = Path.home() / ".scraper" / "sessions"
-    f = f"{cfg.session.user or 'default'}.json"
-    return base / cfg.session.site_host / f
+    return base / s.site_host / f"{s.user or 'default'}.json"
 
 
 def load_context(browser: Browser, cfg: Config) -> tuple[BrowserContext, bool]:
@@ -74,6 +90,13 @@ def load_context(browser: Browser, cfg: Config) -> tuple[BrowserContext, bool]:
     return browser.new_context(), False
 
 
+def _dumps(obj: object) -> bytes:
+    """Serialize ``obj`` to JSON bytes, preferring ``orjson`` when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 def save_context(ctx: BrowserContext, cfg: Config) -> None:
     """
     Persist the BrowserContext storage_state to disk atomically.
@@ -81,21 +104,29 @@ def save_context(ctx: BrowserContext, cfg: Config) -> None:
     If ``cfg.session.save_on_success`` is False the function is a no-op.
     The state is written to a temporary file and then replaced to avoid
     producing partial files on interruption.
+    The payload is serialized up front (with ``orjson`` when installed),
+    written with a single ``os.write`` loop and flushed to disk before the
+    replace so a crash never leaves a truncated state file behind.
     """
     if not cfg.session.save_on_success:
         return
     spath = _state_file(cfg)
+    # Serialize before touching the filesystem so TypeErrors leave no temp file
+    payload = _dumps(ctx.storage_state())
     spath.parent.mkdir(parents=True, exist_ok=True)
     tmp_fd, tmp_path = tempfile.mkstemp(dir=spath.parent)
     try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
-            json.dump(ctx.storage_state(), f)
-    except (OSError, TypeError):
-        # On I/O errors or serialization problems ensure the temp fd is closed
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(tmp_fd, view) :]
+        _fdatasync(tmp_fd)
+    except OSError:
+        os.close(tmp_fd)
         with contextlib.suppress(OSError):
-            os.close(tmp_fd)
+            os.unlink(tmp_path)
         raise
-    Path(tmp_path).replace(spath)
+    os.close(tmp_fd)
+    os.replace(tmp_path, spath)
 
 
 def is_ms_login(url: str) -> bool:
@@ -105,10 +136,7 @@ def is_ms_login(url: str) -> bool:
     This is a small heuristic used by auth flows to detect when a
     navigation has landed on an external identity provider.
     """
-    return any(
-        h in (url or "")
-        for h in ["login.microsoftonline.com", "login.live.com", "login.microsoft.com"]
-    )
+    return bool(_MS_LOGIN_RE.search(url or ""))
 
 
 def is_logged_in(page: Page, cfg: Config) -> bool:
@@ -116,13 +144,16 @@ def is_logged_in(page: Page, cfg: Config) -> bool:
     Best-effort check that a Page represents an authenticated view.
 
     If the configuration provides a ``logged_in_guard`` selector it will
-    be used. Otherwise a heuristic is applied: the current URL should not
-    be an MS login URL and should contain the configured site host.
+    be used; an instant ``count()`` rules out missing guards before the
+    visibility check. Otherwise a heuristic is applied: the current URL
+    should not be an MS login URL and should contain the configured site
+    host.
     """
     guard = cfg.selectors.get("logged_in_guard")
     if guard:
         try:
-            return page.locator(guard).first.is_visible(timeout=1000)
+            loc = page.locator(guard)
+            return bool(loc.count()) and loc.first.is_visible()
         except PlaywrightError:
             return False
     return (not is_ms_login(page.url)) and cfg.session.site_host in (page.url or "")
@@ -132,17 +163,23 @@ def wait_until(pred: Callable[[], bool], timeout_s: int, poll_ms: int = 250) ->
     """
     Poll ``pred`` until it returns True or ``timeout_s`` elapses.
 
-    The predicate is executed repeatedly with a delay of ``poll_ms``
-    milliseconds between attempts. Exceptions raised by ``pred`` are
-    logged at the debug level and treated as a False result.
+    The predicate is executed repeatedly with an exponential backoff that
+    starts at 25 ms and is capped at ``poll_ms`` milliseconds, so fast
+    transitions are noticed quickly while long waits still poll gently.
+    Exceptions raised by ``pred`` are logged at the debug level, treated
+    as a False result, and reset the backoff.
     """
+    max_delay = poll_ms / 1000
+    delay = min(_MIN_POLL_S, max_delay)
     deadline = time.monotonic() + timeout_s
-    while time.monotonic() < deadline:
+    while (now := time.monotonic()) < deadline:
         try:
             if pred():
                 return True
         except Exception as exc:  # noqa: BLE001 - deliberate: predicate functions may raise transient errors
             # Log unexpected errors during predicate evaluation, but continue polling
             logger.debug("wait_until: predicate raised an exception: %s", exc)
-        time.sleep(poll_ms / 1000)
+            delay = min(_MIN_POLL_S, max_delay)
+        time.sleep(min(delay, deadline - now))
+        delay = min(delay * 1.5, max_delay)
     return False
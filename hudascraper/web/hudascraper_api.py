@@ -3,10 +3,11 @@ import logging
 import pathlib
 import re
 from datetime import UTC, datetime
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 from urllib.parse import urlparse
 
 from fastapi import Body, FastAPI, HTTPException, Query
+from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
 from hudascraper import Config, GenericScraper, MsSsoAuth, coerce_nested
@@ -16,6 +17,9 @@ DATA_DIR.mkdir(exist_ok=True)
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Anything outside [A-Za-z0-9] is collapsed to "-" in run-id labels
+_UNSAFE = re.compile(r"[^A-Za-z0-9]+")
+
 
 class ScrapeRequest(BaseModel):
     config: dict[str, Any]
@@ -73,20 +77,19 @@ def scrape(
     # Create a human-readable run directory name in the requested format:
     # {<date>-<time>-<session.site_host>-<session.user>}
     now = datetime.now(tz=UTC)
-    date_part = now.strftime("%Y-%m-%d")
-    time_part = now.strftime("%H%M%S")
+    stamp = now.strftime("%Y-%m-%d-%H%M%S")
 
     # Derive a filesystem-safe host label from the base_url when available
     try:
         host = urlparse(cfg.base_url).hostname or "site"
     except (AttributeError, ValueError, TypeError):
         host = "site"
-    host_label = re.sub(r"[^A-Za-z0-9]+", "-", host).strip("-") or "site"
+    host_label = _UNSAFE.sub("-", host).strip("-") or "site"
 
     # Username label (from request) or anonymous
-    user_label = re.sub(r"[^A-Za-z0-9]+", "-", (user or "anon")).strip("-")
+    user_label = _UNSAFE.sub("-", user or "anon").strip("-")
 
-    run_id = f"{date_part}-{time_part}-{host_label}-{user_label}"
+    run_id = f"{stamp}-{host_label}-{user_label}"
     run_dir = DATA_DIR / run_id
     try:
         run_dir.mkdir(parents=True, exist_ok=True)
@@ -95,9 +98,12 @@ def scrape(
         raise HTTPException(500, "Failed to create run directory") from None
 
     try:
+        # One vectorized to_dict pass instead of boxing every row as a Series
+        records = dframe.to_dict(orient="records")
         with (run_dir / "result.jsonl").open("w", encoding="utf-8") as outf:
-            for _, row in dframe.iterrows():
-                outf.write(json.dumps(row.to_dict(), ensure_ascii=False) + "\n")
+            outf.writelines(
+                json.dumps(rec, ensure_ascii=False) + "\n" for rec in records
+            )
     except OSError:
         logger.exception("Failed to write result.jsonl in %s", run_dir)
         raise HTTPException(500, "Failed to persist results") from None
@@ -107,7 +113,7 @@ def scrape(
         "rows": len(dframe),
         "cols": len(dframe.columns),
         "page_count": dframe.attrs.get("page_count", "?"),
-        "timestamp": datetime.now(tz=UTC).isoformat(),
+        "timestamp": now.isoformat(),
     }
     try:
         with (run_dir / "meta.json").open("w", encoding="utf-8") as f:
@@ -119,19 +125,60 @@ def scrape(
     return {"run_id": run_id, "rows": len(dframe)}
 
 
-@server.get("/results/{run_id}")
-def get_results(run_id: str):
+def _run_dir(run_id: str) -> pathlib.Path:
     run_dir = DATA_DIR / run_id
     if not run_dir.exists():
         raise HTTPException(404, "Run not found")
+    return run_dir
+
+
+def _read_meta(run_dir: pathlib.Path) -> dict[str, Any]:
     with (run_dir / "meta.json").open(encoding="utf-8") as f:
-        meta = json.load(f)
+        return json.load(f)
+
+
+@server.get("/results/{run_id}")
+def get_results(
+    run_id: str,
+    fmt: Annotated[
+        Literal["ndjson", "combined"],
+        Query(
+            alias="format",
+            description="'ndjson' streams result.jsonl as-is; "
+            "'combined' returns {'meta': ..., 'items': [...]}",
+        ),
+    ] = "ndjson",
+):
+    run_dir = _run_dir(run_id)
+    result = run_dir / "result.jsonl"
+    if not result.is_file():
+        raise HTTPException(404, "Results not found")
+    if fmt == "ndjson":
+        # Serve the file bytes untouched (sendfile where the server supports
+        # it) instead of parsing and re-encoding every row in memory
+        return FileResponse(result, media_type="application/x-ndjson")
+
     items = []
     try:
-        with (run_dir / "result.jsonl").open(encoding="utf-8") as f:
+        meta = _read_meta(run_dir)
+        with result.open(encoding="utf-8") as f:
             for line in f:
                 items.append(json.loads(line))
+    except FileNotFoundError:
+        raise HTTPException(404, "Results not found") from None
     except OSError:
         logger.exception("Failed to read results for %s", run_id)
         raise HTTPException(500, "Failed to read results") from None
     return {"meta": meta, "items": items}
+
+
+@server.get("/results/{run_id}/meta")
+def get_results_meta(run_id: str):
+    run_dir = _run_dir(run_id)
+    try:
+        return _read_meta(run_dir)
+    except FileNotFoundError:
+        raise HTTPException(404, "Metadata not found") from None
+    except OSError:
+        logger.exception("Failed to read metadata for %s", run_id)
+        raise HTTPException(500, "Failed to read metadata") from None
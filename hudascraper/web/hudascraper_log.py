@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import threading
 
 
 class LogBroker:
@@ -10,36 +11,76 @@ class LogBroker:
     Fan-out log broker.
 
     Each subscriber gets its own asyncio.Queue.
-    publish() is non-blocking; if a subscriber is too slow, we drop messages for that subscriber.
+    publish() is non-blocking and safe to call from any thread: queue puts are
+    scheduled onto the subscribers' event loop. Queues are bounded; if a
+    subscriber is too slow its oldest queued message is evicted to make room
+    and the eviction is counted, so the newest logs always get through.
     """
 
-    def __init__(self, max_queue_size: int = 1000) -> None:
-        self._subscribers: set[asyncio.Queue[str]] = set()
+    def __init__(self, max_queue_size: int = 1024) -> None:
+        self._subscribers: list[asyncio.Queue[str]] = []
         self._max_queue_size = max_queue_size
-        self._lock = asyncio.Lock()
+        # Plain threading lock: publish() runs on logging threads, not the loop
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._dropped: dict[asyncio.Queue[str], int] = {}
 
-    async def connect(self) -> asyncio.Queue[str]:
+    def subscribe(self) -> asyncio.Queue[str]:
+        """Register a new subscriber queue; call from the event loop thread."""
         q: asyncio.Queue[str] = asyncio.Queue(maxsize=self._max_queue_size)
-        async with self._lock:
-            self._subscribers.add(q)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.append(q)
         return q
 
+    def unsubscribe(self, q: asyncio.Queue[str]) -> None:
+        with self._lock:
+            if q in self._subscribers:
+                self._subscribers.remove(q)
+            self._dropped.pop(q, None)
+
+    async def connect(self) -> asyncio.Queue[str]:
+        # Async shim kept for existing callers
+        return self.subscribe()
+
     async def disconnect(self, q: asyncio.Queue[str]) -> None:
-        async with self._lock:
-            self._subscribers.discard(q)
+        self.unsubscribe(q)
+
+    def dropped(self, q: asyncio.Queue[str]) -> int:
+        """Return how many messages were dropped for subscriber ``q``."""
+        return self._dropped.get(q, 0)
+
+    def take_dropped(self, q: asyncio.Queue[str]) -> int:
+        """Return and reset the drop count for ``q``; call from the loop thread."""
+        return self._dropped.pop(q, 0)
 
     def publish(self, message: str) -> None:
-        # Called from logging threads; avoid awaits.
-        subscribers = tuple(self._subscribers)
+        # Called from logging threads; avoid awaits and never touch the
+        # (non thread-safe) queues here — hand the put to the loop thread.
+        with self._lock:
+            loop = self._loop
+            subscribers = self._subscribers[:]
+        if loop is None or loop.is_closed():
+            return
         for q in subscribers:
             try:
-                q.put_nowait(message)
-            except asyncio.QueueFull:
-                # Drop oldest-ish: try one get to make room; if still full, drop message.
-                with contextlib.suppress(Exception):
-                    q.get_nowait()
-                with contextlib.suppress(Exception):
-                    q.put_nowait(message)
+                loop.call_soon_threadsafe(self._try_put, q, message)
+            except RuntimeError:
+                # Loop closed between the check and the call
+                return
+
+    def _try_put(self, q: asyncio.Queue[str], message: str) -> None:
+        # Runs on the event loop thread, so get/put cannot interleave
+        with self._lock:
+            if q not in self._subscribers:
+                # Scheduled before unsubscribe(): do not recreate its drop
+                # counter (that would leak the entry and keep q alive)
+                return
+        if q.full():
+            with contextlib.suppress(asyncio.QueueEmpty):
+                q.get_nowait()  # evict the oldest message
+            self._dropped[q] = self._dropped.get(q, 0) + 1
+        q.put_nowait(message)
 
 
 # Singleton broker
@@ -1,21 +1,140 @@
 # server_manager.py
 import atexit
 import contextlib
+import ipaddress
 import logging
 import os
+import select
 import signal
+import socket
 import subprocess
 import sys
 import threading
 import time
 from collections import deque
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from itertools import islice
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
 
+@contextlib.contextmanager
+def _watch_exit(pid: int) -> Iterator[Callable[[float], bool]]:
+    """
+    Yield ``wait(seconds) -> bool`` that returns True as soon as ``pid`` exits.
+
+    Uses a pidfd on Linux and a kqueue NOTE_EXIT filter on macOS/BSD so the
+    wait wakes up immediately on process death. Elsewhere (or if the pid is
+    already gone) it degrades to a plain sleep returning False; callers
+    should still check ``Popen.poll()``.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            fd = pidfd_open(pid)
+        except OSError:
+            fd = None
+        if fd is not None:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            try:
+                yield lambda s: bool(poller.poll(max(s, 0) * 1000))
+            finally:
+                os.close(fd)
+            return
+
+    if hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            kq.control(
+                [
+                    select.kevent(
+                        pid,
+                        filter=select.KQ_FILTER_PROC,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                        fflags=select.KQ_NOTE_EXIT,
+                    ),
+                ],
+                0,
+                0,
+            )
+        except OSError:
+            kq.close()
+        else:
+            try:
+                yield lambda s: bool(kq.control(None, 1, max(s, 0)))
+            finally:
+                kq.close()
+            return
+
+    def _sleep(s: float) -> bool:
+        time.sleep(max(s, 0))
+        return False
+
+    yield _sleep
+
+
+@lru_cache(maxsize=8)
+def _ip_family(host: str) -> socket.AddressFamily | None:
+    """Return the address family if ``host`` is a literal IP, else None."""
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return None
+    return socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+
+
+def _connect(host: str, port: int, timeout: float) -> socket.socket:
+    # Literal IPs (the default 127.0.0.1) are connected directly, skipping
+    # getaddrinfo; names still go through create_connection so every
+    # resolved address is tried (e.g. localhost -> ::1, then 127.0.0.1)
+    family = _ip_family(host)
+    if family is None:
+        return socket.create_connection((host, port), timeout=timeout)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect((host, port))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _probe_http(host: str, port: int, path: str, timeout: float) -> bool:
+    """
+    Return True if ``GET path`` on ``host:port`` answers with a 2xx status.
+
+    A bare-socket probe for startup polling: while uvicorn is still booting
+    the connect is refused in microseconds, and once it accepts we only read
+    the status line. Skips the requests/urllib3 stack for each attempt.
+    """
+    # IPv6 literals must be bracketed in the Host header
+    authority = f"[{host}]" if _ip_family(host) == socket.AF_INET6 else host
+    try:
+        with _connect(host, port, timeout) as sock:
+            sock.sendall(
+                f"GET {path} HTTP/1.1\r\nHost: {authority}:{port}\r\n"
+                "Connection: close\r\n\r\n".encode("ascii"),
+            )
+            with sock.makefile("rb") as f:
+                status = f.readline(256)
+    except OSError:
+        return False
+    parts = status.split(None, 2)
+    return len(parts) >= 2 and parts[0].startswith(b"HTTP/") and parts[1][:1] == b"2"
+
+
 class ServerManager:
+    # How long ensure_running() reuses the last is_http_up() result
+    HTTP_UP_TTL_S = 2.0
+    # How long stop() lets the log reader drain output after the exit
+    LOG_DRAIN_S = 2.0
+
     def __init__(
         self,
         app_path: str = "hudascraper.web:server",
@@ -36,10 +155,28 @@ class ServerManager:
         self.env = {**os.environ, **(env or {})}
 
         self._proc: subprocess.Popen | None = None
+        # deque.append/list(deque) run entirely in C under the GIL, so the log
+        # buffer needs no lock; see _append_log
         self._log_buf = deque(maxlen=log_max_lines)
+        self._ts_cache: tuple[int, str] = (-1, "")
+        # (n, newest line, buffer length, joined text) of the last tail_logs
+        self._tail_snapshot: tuple[int, str | None, int, str] | None = None
         self._reader_thread: threading.Thread | None = None
+        self._reader_stop = threading.Event()
         self._lock = threading.RLock()
 
+        # Keep-alive session for health probes: reuses one localhost
+        # connection instead of a TCP handshake per probe
+        self._session = requests.Session()
+        self._session.headers["Connection"] = "keep-alive"
+        self._session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=4),
+        )
+        # (monotonic timestamp, result) of the last HTTP probe; read only by
+        # ensure_running()
+        self._http_up_cache: tuple[float, bool] = (float("-inf"), False)
+
         # Register an atexit hook to ensure the managed server is stopped
         with contextlib.suppress(Exception):
             atexit.register(self.stop)
@@ -58,6 +195,7 @@ class ServerManager:
     # ---- Public API
 
     def start(self, wait_ready_timeout: float = 20.0) -> None:
+        self.invalidate_http_cache()
         with self._lock:
             if self.is_managed_running():
                 return
@@ -80,12 +218,14 @@ class ServerManager:
             popen_kwargs = {
                 "stdout": subprocess.PIPE,
                 "stderr": subprocess.STDOUT,
-                "bufsize": 1,
-                "universal_newlines": True,
+                "bufsize": 0,  # raw pipe: _read_stdout reads it in 64 KiB chunks
                 "env": self.env,
             }
             if os.name == "posix":
-                popen_kwargs["preexec_fn"] = os.setsid  # new process group
+                # New session/process group via setsid() in the C child code:
+                # unlike preexec_fn, no Python runs between fork and exec, so
+                # it is safe with the log-reader and other threads running
+                popen_kwargs["start_new_session"] = True
             else:
                 popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP  # type: ignore[attr-defined]
 
@@ -94,9 +234,15 @@ class ServerManager:
             self._append_log(f"$ {' '.join(cmd)}")
             self._proc = subprocess.Popen(cmd, **popen_kwargs)
 
-            # Start log reader
+            # Start log reader. Each reader gets its own process and stop
+            # event, so a reader still draining a previous server is never
+            # revived (or handed the new pipe) by a restart.
+            self._reader_stop = threading.Event()
             self._reader_thread = threading.Thread(
-                target=self._read_stdout, name="uvicorn-log-reader", daemon=True,
+                target=self._read_stdout,
+                args=(self._proc, self._reader_stop),
+                name="uvicorn-log-reader",
+                daemon=True,
             )
             self._reader_thread.start()
 
@@ -138,23 +284,49 @@ class ServerManager:
 
         with self._lock:
             self._proc = None
-            # Let reader thread exit as the pipe closes
+
+        # Let the reader drain uvicorn's shutdown output (and any traceback)
+        # to EOF; only cut it off if a grandchild keeps the pipe open
+        reader, reader_stop = self._reader_thread, self._reader_stop
+        if reader is not None:
+            reader.join(timeout=self.LOG_DRAIN_S)
+        reader_stop.set()
+
+        # Drop pooled connections to the stopped server
+        self._session.close()
+        self.invalidate_http_cache()
 
     def is_managed_running(self) -> bool:
         with self._lock:
             return self._proc is not None and self._proc.poll() is None
 
     def is_http_up(self, timeout: float = 1.2) -> bool:
+        # Always a live probe: readiness loops poll this. Callers that only
+        # display the state (the Streamlit status row) debounce it themselves.
         try:
-            r = requests.get(self.base_url() + self.health_probe_path, timeout=timeout)
+            r = self._session.get(
+                self.base_url() + self.health_probe_path,
+                timeout=timeout,
+            )
         except requests.RequestException:
-            return False
+            up = False
         else:
-            return r.ok
+            up = r.ok
+        self._http_up_cache = (time.monotonic(), up)
+        return up
+
+    def invalidate_http_cache(self) -> None:
+        """Force the next :meth:`ensure_running` call to probe the server."""
+        self._http_up_cache = (float("-inf"), False)
 
     def ensure_running(self, wait_ready_timeout: float = 20.0) -> None:
-        # If HTTP already up (externally started), do nothing.
-        if self.is_http_up():
+        # If HTTP already up (externally started), do nothing. Streamlit
+        # reruns call this in bursts, so a probe younger than HTTP_UP_TTL_S
+        # is reused here; start()/stop() invalidate it.
+        ts, up = self._http_up_cache
+        if time.monotonic() - ts >= self.HTTP_UP_TTL_S:
+            up = self.is_http_up()
+        if up:
             return
         # If we have a managed process, ensure it's alive; otherwise start it.
         if not self.is_managed_running():
@@ -164,37 +336,101 @@ class ServerManager:
         return f"http://{self.host}:{self.port}"
 
     def tail_logs(self, n: int = 500) -> str:
-        with self._lock:
-            return "\n".join(list(self._log_buf)[-n:])
+        buf = self._log_buf
+        last = buf[-1] if buf else None
+        size = len(buf)
+        # Auto-refresh asks for the same tail repeatedly; reuse the joined
+        # text while no line was appended. The newest line object itself is
+        # the version stamp: every append creates a new string.
+        snap = self._tail_snapshot
+        if snap is not None and snap[0] == n and snap[1] is last and snap[2] == size:
+            return snap[3]
+        # Walk back from the right end: only the last n lines are copied
+        lines = list(islice(reversed(buf), max(n, 0)))
+        lines.reverse()
+        text = "\n".join(lines)
+        self._tail_snapshot = (n, last, size, text)
+        return text
 
     def clear_logs(self) -> None:
-        with self._lock:
-            self._log_buf.clear()
+        self._log_buf.clear()
+        self._tail_snapshot = None
 
     # ---- Internals
 
-    def _read_stdout(self) -> None:
-        proc = self._proc
+    def _read_stdout(
+        self, proc: subprocess.Popen, stop: threading.Event,
+    ) -> None:
         if not proc or not proc.stdout:
             return
-        for line in iter(proc.stdout.readline, ""):
-            self._append_log(line.rstrip("\n"))
-        with contextlib.suppress(Exception):
-            proc.stdout.close()
+        fd = proc.stdout.fileno()
+        # Poll with a timeout so the thread notices stop() even if the pipe
+        # stays open (e.g. a grandchild inherited it). Windows pipes cannot
+        # be polled; there we rely on EOF alone.
+        poller = None
+        if hasattr(select, "poll"):
+            poller = select.poll()
+            poller.register(fd, select.POLLIN | select.POLLHUP)
+        pending = bytearray()
+        try:
+            while not stop.is_set():
+                if poller is not None and not poller.poll(500):
+                    continue
+                data = os.read(fd, 65536)
+                if not data:
+                    break
+                pending += data
+                end = pending.rfind(b"\n")
+                if end < 0:
+                    continue
+                chunk = bytes(pending[:end])
+                del pending[: end + 1]
+                for line in chunk.split(b"\n"):
+                    self._append_log(line.rstrip(b"\r").decode("utf-8", "replace"))
+            if pending:
+                self._append_log(pending.decode("utf-8", "replace"))
+        except OSError:
+            logger.debug("Server log pipe closed", exc_info=True)
+        finally:
+            with contextlib.suppress(Exception):
+                proc.stdout.close()
 
     def _append_log(self, line: str) -> None:
-        with self._lock:
-            ts = time.strftime("%H:%M:%S")
-            self._log_buf.append(f"[{ts}] {line}")
+        # Lock-free: called per uvicorn output line from the reader thread
+        # (and occasionally from start/stop). Format the clock once per
+        # second instead of calling localtime() for every line.
+        now = int(time.time())
+        sec, ts = self._ts_cache
+        if sec != now:
+            ts = time.strftime("%H:%M:%S", time.localtime(now))
+            self._ts_cache = (now, ts)
+        self._log_buf.append(f"[{ts}] {line}")
 
     def _wait_until_ready(self, timeout: float) -> None:
-        start = time.time()
-        while time.time() - start < timeout:
-            if not self.is_managed_running():
-                # Process died early
-                break
-            if self.is_http_up(timeout=0.8):
-                self._append_log("Server is ready.")
-                return
-            time.sleep(0.25)
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            proc = self._proc
+        if proc is None:
+            return
+        delay = 0.02
+        with _watch_exit(proc.pid) as wait_exit:
+            while (remaining := deadline - time.monotonic()) > 0:
+                if proc.poll() is not None:
+                    # Process died early
+                    self._append_log(
+                        f"Server exited with code {proc.returncode} before becoming ready.",
+                    )
+                    return
+                if _probe_http(
+                    self.host,
+                    self.port,
+                    self.health_probe_path,
+                    timeout=0.2,
+                ):
+                    self._append_log("Server is ready.")
+                    self._http_up_cache = (time.monotonic(), True)
+                    return
+                # Sleep until the next probe, waking at once if the child exits
+                wait_exit(min(delay, remaining))
+                delay = min(delay * 2, 0.16)
         self._append_log("Server did not become ready within timeout.")
@@ -1,7 +1,9 @@
 # app/websocket_routes.py
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import json
 
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
@@ -9,6 +11,10 @@ from .hudascraper_log import broker
 
 router = APIRouter()
 
+SEND_TIMEOUT_S = 5.0
+MAX_BATCH = 256  # log lines per websocket frame
+
+
 @router.websocket("/ws/logs")
 async def logs_ws(
     websocket: WebSocket,
@@ -18,15 +24,43 @@ async def logs_ws(
 ):
     await websocket.accept()
     q = await broker.connect()
+    seq = 0
     try:
         # Optional: send a hello so the client knows it's live
-        await websocket.send_text('{"type":"hello","msg":"log-stream-ready"}')
+        await _send(websocket, '{"type":"hello","msg":"log-stream-ready"}')
         while True:
-            msg = await q.get()
-            await websocket.send_text(msg)
-    except WebSocketDisconnect:
+            # Drain whatever else is already queued: a burst goes out as one
+            # frame instead of one send (and ASGI round-trip) per line
+            batch = [await q.get()]
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(q.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            # Tell the client how many lines were evicted before this batch;
+            # seq is shared with log frames so gaps are detectable either way
+            dropped = broker.take_dropped(q)
+            if dropped:
+                seq += 1
+                await _send(
+                    websocket,
+                    json.dumps({"type": "dropped", "count": dropped, "seq": seq}),
+                )
+            items = []
+            for msg in batch:
+                seq += 1
+                items.append({"seq": seq, "payload": msg})
+            frame = items[0] if len(items) == 1 else {"type": "batch", "items": items}
+            await _send(websocket, json.dumps(frame))
+    except (WebSocketDisconnect, TimeoutError):
         pass
     finally:
         await broker.disconnect(q)
         with contextlib.suppress(Exception):
             await websocket.close()
+
+
+async def _send(websocket: WebSocket, text: str) -> None:
+    # Bound each send so a stalled client is dropped well before TCP
+    # keepalive would notice
+    await asyncio.wait_for(websocket.send_text(text), timeout=SEND_TIMEOUT_S)
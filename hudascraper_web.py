@@ -1,16 +1,27 @@
+from __future__ import annotations
+
 import contextlib
 import json
 import logging
 import subprocess
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
-import requests
+import requests  # already loaded by ServerManager, so nothing to defer
 import streamlit as st
 
 from hudascraper.web import ServerManager
 
+if TYPE_CHECKING:
+    # pandas is imported where first used so the first paint does
+    # not wait on them
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional: faster config/NDJSON (de)serialization
+    orjson = None
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
@@ -38,6 +49,21 @@ st.markdown(
 )
 
 
+_STATUS_TTL_S = 5.0
+
+
+def _status_http_up(manager: ServerManager) -> bool:
+    # Debounced for the status row: probe at most once per _STATUS_TTL_S
+    # however often the script reruns. Kept in session_state because module
+    # globals (and any lru_cache) are rebuilt on every Streamlit rerun.
+    now = time.monotonic()
+    cached = st.session_state.get("http_up")
+    if cached is None or cached[0] is not manager or now - cached[1] >= _STATUS_TTL_S:
+        cached = (manager, now, manager.is_http_up())
+        st.session_state["http_up"] = cached
+    return cached[2]
+
+
 # ----------------------------
 # Server manager (session-scoped)
 # ----------------------------
@@ -100,6 +126,7 @@ if apply:
 if start:
     try:
         sm.start()
+        st.session_state.pop("http_up", None)
         st.sidebar.success("Start requested.")
     except (OSError, RuntimeError, subprocess.SubprocessError) as e:
         logger.exception("Server start failed")
@@ -108,6 +135,7 @@ if start:
 if stop:
     try:
         sm.stop()
+        st.session_state.pop("http_up", None)
         st.sidebar.info("Stop requested.")
     except (OSError, RuntimeError, subprocess.SubprocessError) as e:
         logger.exception("Server stop failed")
@@ -120,7 +148,7 @@ status_cols = st.columns(3)
 with status_cols[0]:
     st.markdown(
         '<div class="metric-box">HTTP reachable<br><b>{}</b></div>'.format(
-            "Yes" if sm.is_http_up() else "No",
+            "Yes" if _status_http_up(sm) else "No",
         ),
         unsafe_allow_html=True,
     )
@@ -150,12 +178,25 @@ st.divider()
 # ----------------------------
 def _safe_json_loads(s: str) -> str:
     try:
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(s)
         return json.loads(s)
     except (json.JSONDecodeError, TypeError) as e:
         msg = f"Invalid JSON: {e}"
         raise ValueError(msg)
 
 
+def _http() -> requests.Session:
+    # One keep-alive session per Streamlit browser session, so reruns reuse
+    # the pooled connection to the API instead of reconnecting
+    if "http" not in st.session_state:
+        session = requests.Session()
+        session.headers["Connection"] = "keep-alive"
+        st.session_state["http"] = session
+    return st.session_state["http"]
+
+
 def _post_scrape(
     base_url: str,
     config_obj: dict[str, Any],
@@ -171,21 +212,61 @@ def _post_scrape(
         params["password"] = password
 
     body = {"config": config_obj} if wrapped else config_obj
-    resp = requests.post(url, params=params, json=body, timeout=600)
+    # Serialize once here (orjson when installed) rather than via requests'
+    # json= path, which runs stdlib json.dumps and re-encodes to bytes
+    data = (
+        orjson.dumps(body)
+        if orjson is not None
+        else json.dumps(body).encode("utf-8")
+    )
+    resp = _http().post(
+        url,
+        params=params,
+        data=data,
+        headers={"Content-Type": "application/json"},
+        timeout=600,
+    )
     resp.raise_for_status()
     return resp.json()
 
 
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False)
+def _csv_bytes(base_url: str, run_id: str, _dframe: pd.DataFrame) -> bytes:
+    # Cached on (base_url, run_id) like _get_results (the frame itself is not
+    # hashed): results of a run never change, so reruns reuse the bytes.
+    # Bounded so downloads from a long-lived server do not pile up in memory.
+    return _dframe.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False)
 def _get_results(base_url: str, run_id: str) -> pd.DataFrame:
-    # FastAPI route: GET /results/{run_id}
+    # FastAPI route: GET /results/{run_id} (NDJSON, one record per line).
+    # Cached on (base_url, run_id): a run's results are written once before
+    # /scrape returns, so reruns and repeat fetches skip HTTP and parsing.
+    # Bounded like _csv_bytes so many runs within the TTL cannot hold every
+    # result frame in memory at once.
+    # Failed fetches raise and are therefore never cached.
     url = f"{base_url.rstrip('/')}/results/{run_id}"
-    resp = requests.get(url, timeout=180)
-    resp.raise_for_status()
-    data = resp.json()
-    items: list[dict[str, Any]] = (
-        data.get("items", []) if isinstance(data, dict) else data
-    )
-    return pd.DataFrame(items)
+    import pandas as pd
+
+    loads = orjson.loads if orjson is not None else json.loads
+    # Every line comes from the same DataFrame.to_dict(orient="records"), so
+    # keys repeat in the same order: keep only the value tuples (much smaller
+    # than a dict per row) and name the columns once
+    columns: list[str] | None = None
+    rows: list[tuple[Any, ...]] = []
+    # Closing the streamed response returns the pooled connection even when
+    # a line fails to parse partway through
+    with _http().get(url, timeout=180, stream=True) as resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines(chunk_size=64 * 1024):
+            if not line:
+                continue
+            rec = loads(line)
+            if columns is None:
+                columns = list(rec)
+            rows.append(tuple(rec.values()))
+    return pd.DataFrame.from_records(rows, columns=columns)
 
 
 # ----------------------------
@@ -329,7 +410,7 @@ with tab_scrape:
                                         use_container_width=True,
                                         height=420,
                                     )
-                                    csv = dframe.to_csv(index=False).encode("utf-8")
+                                    csv = _csv_bytes(sm.base_url(), run_id, dframe)
                                     st.download_button(
                                         "Download CSV",
                                         data=csv,
@@ -396,7 +477,11 @@ with tab_results:
                     else:
                         st.markdown("#### Extracted data")
                         st.dataframe(dframe, use_container_width=True, height=500)
-                        csv = dframe.to_csv(index=False).encode("utf-8")
+                        csv = _csv_bytes(
+                            sm.base_url(),
+                            run_id_in.strip(),
+                            dframe,
+                        )
                         st.download_button(
                             "Download CSV",
                             data=csv,
@@ -424,28 +509,25 @@ with tab_results:
 with tab_logs:
     st.subheader("Server Logs")
 
-    lc1, lc2, lc3 = st.columns([1, 1, 2])
-    with lc1:
-        if st.button("Clear Logs"):
-            sm.clear_logs()
-    with lc2:
-        manual_refresh = st.button("Refresh now")
-
     auto_refresh = st.checkbox("Auto-refresh logs", value=False)
     interval = st.slider("Refresh interval (s)", 1, 10, 2)
 
-    st.text_area(
-        "Live log tail",
-        value=sm.tail_logs(800),
-        height=420,
-        label_visibility="collapsed",
-    )
-
-    if manual_refresh or (
-        auto_refresh and st.session_state.get("autorefresh_tick", 0) >= 0
-    ):
-        time.sleep(interval)
-        st.session_state["autorefresh_tick"] = (
-            st.session_state.get("autorefresh_tick", 0) + 1
+    # Only this fragment reruns on the timer (and on its buttons), instead
+    # of sleeping and rerunning the whole script with its HTTP probes
+    @st.fragment(run_every=interval if auto_refresh else None)
+    def _log_tail() -> None:
+        lc1, lc2, lc3 = st.columns([1, 1, 2])
+        with lc1:
+            if st.button("Clear Logs"):
+                sm.clear_logs()
+        with lc2:
+            st.button("Refresh now")  # any click reruns the fragment
+
+        st.text_area(
+            "Live log tail",
+            value=sm.tail_logs(800),
+            height=420,
+            label_visibility="collapsed",
         )
-        st.rerun()
+
+    _log_tail()
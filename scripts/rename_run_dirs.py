@@ -9,8 +9,9 @@ Run: python scripts/rename_run_dirs.py
 """
 
 import logging
+import os
 import re
-from datetime import UTC, datetime
+from datetime import datetime
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -21,39 +22,65 @@ if not DATA_DIR.exists():
     logger.info("No .data directory found; nothing to do.")
     raise SystemExit(0)
 
-pattern = re.compile(r"^(?P<ts>\d{8}T\d{6}\d+Z)_(?P<host>[^_]+)_(?P<user>.+)$")
+# Fixed-width timestamp fields are captured directly, so no strptime is needed
+pattern = re.compile(
+    r"^(?P<ts>(?P<date>\d{8})T(?P<time>\d{6})(?P<frac>\d+)Z)"
+    r"_(?P<host>[^_]+)_(?P<user>.+)$",
+    re.ASCII,
+)
 
-mappings = []
-for p in sorted(DATA_DIR.iterdir()):
-    if not p.is_dir():
-        continue
-    m = pattern.match(p.name)
+# Plain string paths in the loops below: no PurePath objects per entry
+data_dir = os.fspath(DATA_DIR)
+
+with os.scandir(data_dir) as it:
+    # DirEntry.is_dir uses the d_type from readdir: no stat per entry
+    listing = list(it)
+# Every existing name, so collisions are resolved in memory, not with stat
+taken = {e.name for e in listing}
+entries = sorted(
+    (e for e in listing if e.is_dir(follow_symlinks=False)),
+    key=lambda e: e.name,
+)
+
+# Plan all renames first, then perform them in one pass
+plan = []
+for entry in entries:
+    m = pattern.match(entry.name)
     if not m:
         continue
-    ts = m.group("ts")
+    d = m.group("date")
+    t = m.group("time")
     host = m.group("host")
     user = m.group("user")
     try:
-        dt = datetime.strptime(ts, "%Y%m%dT%H%M%S%fZ").replace(tzinfo=UTC)
+        # Range-check the fields (what strptime used to do) without its
+        # format-string parser
+        if len(m.group("frac")) > 6:
+            msg = f"fractional seconds too long in {m.group('ts')!r}"
+            raise ValueError(msg)
+        datetime(
+            int(d[:4]), int(d[4:6]), int(d[6:]), int(t[:2]), int(t[2:4]), int(t[4:]),
+        )
     except ValueError as e:
-        logger.warning("Skipping %s: failed to parse timestamp: %s", p.name, e)
+        logger.warning("Skipping %s: failed to parse timestamp: %s", entry.name, e)
         continue
-    date_part = dt.strftime("%Y-%m-%d")
-    time_part = dt.strftime("%H%M%S")
-    new_name = f"{date_part}-{time_part}-{host}-{user}"
-    target = DATA_DIR / new_name
-    # avoid clobbering
+    new_name = f"{d[:4]}-{d[4:6]}-{d[6:]}-{t}-{host}-{user}"
+    # avoid clobbering existing entries and earlier planned targets
+    target = new_name
     suffix = 1
-    while target.exists():
-        target = DATA_DIR / f"{new_name}-{suffix}"
+    while target in taken:
+        target = f"{new_name}-{suffix}"
         suffix += 1
+    taken.add(target)
+    plan.append((entry.name, target))
+
+mappings = []
+for src, dst in plan:
     try:
-        p.rename(target)
-        mappings.append((p.name, target.name))
+        os.rename(os.path.join(data_dir, src), os.path.join(data_dir, dst))
+        mappings.append((src, dst))
     except OSError:
-        logger.exception(
-            "Failed to rename %s -> %s due to OS error", p.name, target.name,
-        )
+        logger.exception("Failed to rename %s -> %s due to OS error", src, dst)
 
 if not mappings:
     logger.info("No directories matched the old pattern; nothing to rename.")
@@ -64,5 +91,5 @@ else:
 
 # List resulting .data contents
 logger.info("\nCurrent .data contents:")
-for p in sorted(DATA_DIR.iterdir()):
-    logger.info("  %s", p.name)
+for name in sorted(os.listdir(data_dir)):
+    logger.info("  %s", name)
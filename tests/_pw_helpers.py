@@ -0,0 +1,39 @@
+"""Shared Playwright helpers for the integration tests."""
+
+
+def goto_fast(page, url: str, **kwargs):
+    """
+    Navigate ``page`` to ``url`` and return once the DOM is parsed.
+
+    Always uses ``wait_until="domcontentloaded"``: ``networkidle`` waits for
+    a 500 ms quiet window that telemetry-heavy IdP pages may never reach.
+    """
+    if kwargs.pop("wait_until", "domcontentloaded") != "domcontentloaded":
+        msg = "goto_fast only supports wait_until='domcontentloaded'"
+        raise ValueError(msg)
+    return page.goto(url, wait_until="domcontentloaded", **kwargs)
+
+
+# The fake MS form's buttons are type="button" with click handlers (Enter
+# would submit the form instead), and "Next" reveals the password area
+# synchronously, so the whole two-step form can be driven in one round-trip.
+_FAKE_MS_LOGIN_JS = """([email, password]) => {
+    document.querySelector("input[name='loginfmt']").value = email;
+    document.querySelector('#next').click();
+    document.querySelector('#pwd').value = password;
+    document.querySelector('#signin').click();
+}"""
+
+
+def fake_ms_login(page, email: str = "test@example.com", password: str = "password"):
+    """
+    Complete the ``test-site/ms-login.html`` form from the app's index page.
+
+    Clicks the app's sign-in button, then fills and submits both steps with a
+    single ``page.evaluate`` instead of one fill/click round-trip per control.
+    Returns once the browser is on ``success.html``.
+    """
+    page.click("#ms-signin")
+    page.wait_for_selector("input[name='loginfmt']", timeout=5000)
+    page.evaluate(_FAKE_MS_LOGIN_JS, [email, password])
+    page.wait_for_url("**/success.html", timeout=5000)
@@ -0,0 +1,167 @@
+import copy
+import os
+import socket
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TEST_SITE = REPO_ROOT / "test-site"
+
+CHROMIUM_TEST_ARGS = [
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+]
+
+# Without the opt-in, skip collecting the Playwright modules altogether (no
+# module parse, no transitive Playwright import) rather than skipping per test
+if os.environ.get("RUN_PLAYWRIGHT_INTEGRATION", "0") != "1":
+    collect_ignore_glob = [
+        "test_js_pagination.py",
+        "test_ms_sso_flow.py",
+        "test_ms_sso_integration.py",
+        "test_public_site_table.py",
+        "test_scrape_sample.py",
+    ]
+
+
+def _require_playwright_integration() -> None:
+    # Heavy Playwright tests only run when explicitly requested
+    if os.environ.get("RUN_PLAYWRIGHT_INTEGRATION", "0") != "1":
+        pytest.skip("Set RUN_PLAYWRIGHT_INTEGRATION=1 to run Playwright integrations")
+    pytest.importorskip("playwright.sync_api")
+
+
+def _apply_test_timeouts(ctx) -> None:
+    # Fail missing-element/navigation cases in seconds rather than after
+    # Playwright's 30 s default; raise via env vars on slow CI hosts
+    ctx.set_default_timeout(int(os.environ.get("PW_TEST_TIMEOUT_MS", "5000")))
+    ctx.set_default_navigation_timeout(
+        int(os.environ.get("PW_TEST_NAV_TIMEOUT_MS", "10000")),
+    )
+
+
+@pytest.fixture(scope="session")
+def playwright_browser():
+    """One Chromium process shared by every integration test in the session."""
+    _require_playwright_integration()
+    from playwright.sync_api import sync_playwright
+
+    launch_kwargs = {}
+    # Opt-in: Chromium's "new" headless mode instead of the headless shell
+    if os.environ.get("HUDASCRAPER_HEADLESS_MODE") == "new":
+        launch_kwargs["channel"] = "chromium"
+
+    pw = sync_playwright().start()
+    browser = pw.chromium.launch(
+        headless=True,
+        # DOM-only table tests: no GPU process, no extensions, and no
+        # reliance on a (often tiny) /dev/shm in containers
+        args=CHROMIUM_TEST_ARGS,
+        **launch_kwargs,
+    )
+    try:
+        yield browser
+    finally:
+        browser.close()
+        pw.stop()
+
+
+@pytest.fixture
+def browser_context(playwright_browser):
+    """A fresh, isolated BrowserContext per test (cheap compared to a launch)."""
+    ctx = playwright_browser.new_context()
+    _apply_test_timeouts(ctx)
+    try:
+        yield ctx
+    finally:
+        ctx.close()
+
+
+def _wait_port(host: str, port: int, timeout: float = 2.0) -> None:
+    """Return once ``host:port`` accepts TCP connections (or fail the test)."""
+    deadline = time.monotonic() + timeout
+    while True:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex((host, port)) == 0:
+                return
+        if time.monotonic() >= deadline:
+            pytest.fail(f"{host}:{port} not reachable after {timeout}s")
+        time.sleep(0.005)
+
+
+@pytest.fixture(scope="session")
+def test_site_server():
+    """Serve ``test-site/`` on an ephemeral port for the whole session."""
+    handler = partial(SimpleHTTPRequestHandler, directory=str(TEST_SITE))
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    _wait_port("127.0.0.1", httpd.server_port)
+    try:
+        yield f"http://127.0.0.1:{httpd.server_port}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+# Parsed once per session; tests get a deep copy so they can mutate freely
+@pytest.fixture(scope="session")
+def _cfg_ms_raw():
+    # Imported here: the hudascraper package pulls in Playwright, and loading
+    # conftest must not require it
+    from hudascraper.hudasconfig import load_config
+
+    return load_config(str(REPO_ROOT / "config-testsite-ms.json"))
+
+
+@pytest.fixture(scope="session")
+def _cfg_sample_raw():
+    from hudascraper.hudasconfig import load_config
+
+    cfg_path = REPO_ROOT / "config-sample.json"
+    assert cfg_path.exists(), "config-sample.json must exist in repo root"
+    return load_config(str(cfg_path))
+
+
+@pytest.fixture
+def cfg_ms(_cfg_ms_raw):
+    """A private copy of the parsed ``config-testsite-ms.json``."""
+    return copy.deepcopy(_cfg_ms_raw)
+
+
+@pytest.fixture
+def cfg_sample(_cfg_sample_raw):
+    """A private copy of the parsed ``config-sample.json``."""
+    return copy.deepcopy(_cfg_sample_raw)
+
+
+@pytest.fixture(scope="session")
+def ms_storage_state(playwright_browser, test_site_server, tmp_path_factory):
+    """
+    Sign in to the test-site MS flow once and return the storage_state path.
+
+    Tests replay it (``browser.new_context(storage_state=...)`` or the
+    scraper's ``session.path``) instead of repeating the login.
+    """
+    from tests._pw_helpers import fake_ms_login, goto_fast
+
+    # pytest owns (and cleans up) the directory; Playwright writes the file
+    path = tmp_path_factory.mktemp("ms_state") / "storage_state.json"
+    ctx = playwright_browser.new_context()
+    _apply_test_timeouts(ctx)
+    try:
+        page = ctx.new_page()
+        goto_fast(page, f"{test_site_server}/index.html")
+        fake_ms_login(page)
+        ctx.storage_state(path=path)
+    finally:
+        ctx.close()
+    return path
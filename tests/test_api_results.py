@@ -0,0 +1,54 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from hudascraper.web import hudascraper_api as api
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "DATA_DIR", tmp_path)
+    return TestClient(api.server)
+
+
+def _write_run(data_dir, run_id, rows=None, meta=None):
+    run_dir = data_dir / run_id
+    run_dir.mkdir()
+    if rows is not None:
+        (run_dir / "result.jsonl").write_text(
+            "".join(json.dumps(r) + "\n" for r in rows),
+            encoding="utf-8",
+        )
+    if meta is not None:
+        (run_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+
+def test_results_streams_ndjson_and_combines_with_meta(client, tmp_path):
+    _write_run(tmp_path, "run1", rows=[{"x": 1}, {"x": 2}], meta={"rows": 2})
+
+    resp = client.get("/results/run1")
+    assert resp.status_code == 200
+    assert [json.loads(line) for line in resp.text.splitlines()] == [
+        {"x": 1},
+        {"x": 2},
+    ]
+
+    combined = client.get("/results/run1", params={"format": "combined"}).json()
+    assert combined == {"meta": {"rows": 2}, "items": [{"x": 1}, {"x": 2}]}
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "combined"])
+def test_missing_result_file_is_not_found(client, tmp_path, fmt):
+    _write_run(tmp_path, "run1", meta={"rows": 0})
+
+    resp = client.get("/results/run1", params={"format": fmt})
+    assert resp.status_code == 404
+
+
+def test_missing_meta_is_not_found(client, tmp_path):
+    _write_run(tmp_path, "run1", rows=[])
+
+    assert client.get("/results/run1", params={"format": "combined"}).status_code == 404
+    assert client.get("/results/run1/meta").status_code == 404
+    assert client.get("/results/nope/meta").status_code == 404
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Import conftest with Playwright made unimportable and report what loaded
+_PROBE = """
+import importlib.abc, sys
+
+class _NoPlaywright(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] == "playwright":
+            raise ImportError(name)
+
+sys.meta_path.insert(0, _NoPlaywright())
+import tests.conftest as conftest
+
+print(sorted(m for m in sys.modules if m.split(".")[0] == "hudascraper"))
+print(sorted(conftest.collect_ignore_glob))
+"""
+
+
+def test_default_run_loads_conftest_without_playwright():
+    env = {k: v for k, v in os.environ.items() if k != "RUN_PLAYWRIGHT_INTEGRATION"}
+    env["PYTHONPATH"] = str(REPO_ROOT)
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+    # Nothing from the package (and so no Playwright) is imported ...
+    assert out[0] == "[]"
+    # ... and the Playwright modules are kept out of collection
+    assert "test_ms_sso_integration.py" in out[1]
+    assert "test_scrape_sample.py" in out[1]
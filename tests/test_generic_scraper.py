@@ -0,0 +1,93 @@
+import threading
+import time
+from unittest.mock import Mock
+
+from hudascraper.hudasconfig import Config
+from hudascraper.hudascraper import GenericScraper
+
+
+def test_close_is_idempotent() -> None:
+    scraper = GenericScraper.__new__(GenericScraper)
+    scraper.context = Mock()
+    scraper._play = Mock()
+    scraper._reuse_browser = False
+    scraper._closed = False
+
+    scraper.close()
+    scraper.close()
+
+    assert scraper.context.close.call_count == 1
+    assert scraper._play.stop.call_count == 1
+
+
+def _parallel_scraper(scrape_page_range) -> GenericScraper:
+    scraper = GenericScraper.__new__(GenericScraper)
+    scraper.cfg = Config()
+    scraper.page = Mock()
+    scraper.context = Mock()
+    scraper._total_pages = lambda resolver, root: 5
+    scraper._scrape_page_range = scrape_page_range
+    scraper._read_page_at = Mock(
+        side_effect=lambda page, resolver, url, key: (None, [[url]]),
+    )
+    return scraper
+
+
+def _read_parallel(scraper: GenericScraper):
+    extractor = Mock()
+    extractor.read_page.return_value = (["h"], [["p1"]])
+    return scraper._read_pages_parallel(
+        Mock(),
+        extractor,
+        Mock(),
+        "page-{n}",
+        workers=2,
+        max_pages=0,
+    )
+
+
+def test_parallel_read_rereads_failed_pages_in_order() -> None:
+    def scrape(page_nums, template, state, delay_s, frames_key, stop):
+        # Page 3 "times out" in its worker
+        return {n: (None, [[f"p{n}"]]) for n in page_nums if n != 3}
+
+    scraper = _parallel_scraper(scrape)
+
+    rows = [r[0][0] for _, r in _read_parallel(scraper)]
+
+    assert rows == ["p1", "p2", "page-3", "p4", "p5"]
+    scraper._read_page_at.assert_called_once()
+
+
+def test_parallel_read_stops_workers_when_closed_early() -> None:
+    seen_stop = []
+    running = threading.Event()
+
+    def scrape(page_nums, template, state, delay_s, frames_key, stop):
+        if 4 in page_nums:
+            # Second shard: would keep reading until told to stop
+            running.set()
+            seen_stop.append(stop.wait(5))
+            return {}
+        return {n: (None, [[f"p{n}"]]) for n in page_nums}
+
+    pages = _read_parallel(_parallel_scraper(scrape))
+    next(pages)
+    next(pages)
+    assert running.wait(5)
+
+    started = time.monotonic()
+    pages.close()
+
+    assert time.monotonic() - started < 2
+    assert seen_stop == [True]
+
+
+def test_parallel_pages_is_skipped_when_rows_per_page_is_set() -> None:
+    scraper = GenericScraper.__new__(GenericScraper)
+    scraper.cfg = Config()
+    scraper.cfg.data_normalization = {"parallel_pages": 3}
+    assert scraper._page_workers() == 3
+
+    scraper.cfg.rows_per_page = {"control": {"candidates": [{"selector": "#n"}]}}
+    assert scraper._page_workers() == 0
@@ -0,0 +1,247 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hudascraper.web.hudascraper_mgr import ServerManager, _probe_http, _watch_exit
+
+
+def test_watch_exit_wakes_when_child_exits():
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        with _watch_exit(proc.pid) as wait_exit:
+            assert wait_exit(0.05) is False
+            proc.terminate()
+            start = time.monotonic()
+            wait_exit(5.0)
+            assert time.monotonic() - start < 2.0
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_tail_logs_returns_last_lines_in_order():
+    sm = ServerManager.__new__(ServerManager)
+    sm._log_buf = deque((f"l{i}" for i in range(10)), maxlen=10)
+    sm._tail_snapshot = None
+    assert sm.tail_logs(3) == "l7\nl8\nl9"
+    assert sm.tail_logs(50).splitlines()[0] == "l0"
+    assert sm.tail_logs(0) == ""
+
+
+def test_tail_logs_reuses_snapshot_until_new_lines_arrive():
+    sm = ServerManager.__new__(ServerManager)
+    sm._log_buf = deque(maxlen=3)
+    sm._ts_cache = (-1, "")
+    sm._tail_snapshot = None
+    for i in range(3):
+        sm._append_log(f"l{i}")
+
+    first = sm.tail_logs(2)
+    assert sm.tail_logs(2) is first
+
+    sm._append_log("l3")  # buffer is full: length is unchanged
+    assert sm.tail_logs(2).endswith("l3")
+
+    sm.clear_logs()
+    assert sm.tail_logs(2) == ""
+
+
+def test_probe_http_checks_status_line():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            self.send_response(200 if self.path == "/ok" else 404)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    port = httpd.server_address[1]
+    try:
+        assert _probe_http("127.0.0.1", port, "/ok", timeout=1.0)
+        assert not _probe_http("127.0.0.1", port, "/missing", timeout=1.0)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert not _probe_http("127.0.0.1", port, "/ok", timeout=0.2)
+
+
+def test_probe_http_brackets_ipv6_host():
+    if not socket.has_ipv6:
+        pytest.skip("no IPv6 support")
+    hosts = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            hosts.append(self.headers["Host"])
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    class Server6(ThreadingHTTPServer):
+        address_family = socket.AF_INET6
+
+    try:
+        httpd = Server6(("::1", 0), Handler)
+    except OSError:
+        pytest.skip("cannot bind ::1")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    port = httpd.server_address[1]
+    try:
+        assert _probe_http("::1", port, "/ok", timeout=1.0)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert hosts == [f"[::1]:{port}"]
+
+
+def test_read_stdout_splits_chunked_output_into_lines():
+    script = (
+        "import sys; sys.stdout.write('a\\nb\\r\\n'); sys.stdout.flush();"
+        "sys.stdout.write('par'); sys.stdout.flush(); sys.stdout.write('tial\\nend')"
+    )
+    sm = ServerManager.__new__(ServerManager)
+    sm._log_buf = deque(maxlen=10)
+    sm._ts_cache = (-1, "")
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script], stdout=subprocess.PIPE, bufsize=0,
+    )
+    sm._read_stdout(proc, threading.Event())
+    proc.wait()
+    assert [line.split("] ", 1)[1] for line in sm._log_buf] == [
+        "a",
+        "b",
+        "partial",
+        "end",
+    ]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="select.poll is POSIX-only")
+def test_read_stdout_stops_only_on_its_own_event():
+    sm = ServerManager.__new__(ServerManager)
+    sm._log_buf = deque(maxlen=10)
+    sm._ts_cache = (-1, "")
+    script = "import time; time.sleep(30)"
+    readers = []
+    for _ in range(2):
+        proc = subprocess.Popen(
+            [sys.executable, "-c", script], stdout=subprocess.PIPE, bufsize=0,
+        )
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=sm._read_stdout, args=(proc, stop), daemon=True,
+        )
+        thread.start()
+        readers.append((proc, stop, thread))
+    try:
+        (_, old_stop, old_thread), (_, _, new_thread) = readers
+        old_stop.set()
+        old_thread.join(timeout=2)
+        assert not old_thread.is_alive()
+        assert new_thread.is_alive()
+    finally:
+        for proc, stop, thread in readers:
+            stop.set()
+            proc.kill()
+            proc.wait()
+            thread.join(timeout=2)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="stop() signals the process group")
+def test_stop_keeps_shutdown_output_in_the_log():
+    script = (
+        "import signal, sys, time\n"
+        "def bye(*a):\n"
+        "    time.sleep(0.7)  # longer than the reader's poll interval\n"
+        "    print('shutdown complete', flush=True)\n"
+        "    sys.exit(0)\n"
+        "signal.signal(signal.SIGTERM, bye)\n"
+        "print('ready', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    sm = ServerManager.__new__(ServerManager)
+    sm._log_buf = deque(maxlen=10)
+    sm._ts_cache = (-1, "")
+    sm._reader_stop = threading.Event()
+    sm._lock = threading.RLock()
+    sm._session = Mock()
+    sm._proc = subprocess.Popen(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        bufsize=0,
+        start_new_session=True,
+    )
+    sm._reader_thread = threading.Thread(
+        target=sm._read_stdout, args=(sm._proc, sm._reader_stop), daemon=True,
+    )
+    sm._reader_thread.start()
+    deadline = time.monotonic() + 5
+    while not any(line.endswith("ready") for line in sm._log_buf):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    sm.stop()
+
+    assert any(line.endswith("shutdown complete") for line in sm._log_buf)
+    assert not sm._reader_thread.is_alive()
+
+
+def test_is_http_up_probes_on_every_call():
+    # Readiness loops poll is_http_up; each call must see the current state
+    sm = ServerManager.__new__(ServerManager)
+    sm.host, sm.port, sm.health_probe_path = "127.0.0.1", 1, "/openapi.json"
+    sm._session = Mock()
+    sm._session.get.side_effect = [Mock(ok=False), Mock(ok=True)]
+
+    assert not sm.is_http_up()
+    assert sm.is_http_up()
+    assert sm._session.get.call_count == 2
+
+
+def test_ensure_running_reuses_a_recent_probe_until_invalidated():
+    sm = ServerManager.__new__(ServerManager)
+    sm.host, sm.port, sm.health_probe_path = "127.0.0.1", 1, "/openapi.json"
+    sm._session = Mock()
+    sm._session.get.return_value = Mock(ok=True)
+    sm.invalidate_http_cache()
+
+    sm.ensure_running()
+    sm.ensure_running()
+    assert sm._session.get.call_count == 1
+    # Direct checks stay live for readiness loops
+    assert sm.is_http_up()
+    assert sm._session.get.call_count == 2
+
+    sm.invalidate_http_cache()
+    sm.ensure_running()
+    assert sm._session.get.call_count == 3
+
+
+def test_append_log_formats_timestamp_once_per_second():
+    sm = ServerManager.__new__(ServerManager)
+    sm._log_buf = deque(maxlen=10)
+    sm._ts_cache = (-1, "")
+    with (
+        patch("hudascraper.web.hudascraper_mgr.time.time", return_value=1000.5),
+        patch(
+            "hudascraper.web.hudascraper_mgr.time.strftime",
+            return_value="00:16:40",
+        ) as strftime,
+    ):
+        for i in range(5):
+            sm._append_log(f"line {i}")
+    assert strftime.call_count == 1
+    assert list(sm._log_buf)[-1] == "[00:16:40] line 4"
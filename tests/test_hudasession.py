@@ -0,0 +1,83 @@
+import json
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from hudascraper.hudasconfig import Config
+from hudascraper.hudasession import (
+    _state_file,
+    is_ms_login,
+    save_context,
+    wait_until,
+)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://login.microsoftonline.com/common/oauth2/v2.0/", True),
+        ("https://login.live.com/", True),
+        ("https://login.microsoft.com/", True),
+        ("https://app.example/after", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_is_ms_login(url, expected) -> None:
+    assert is_ms_login(url) is expected
+
+
+def test_wait_until_backs_off_from_a_short_first_delay() -> None:
+    calls = []
+
+    def pred() -> bool:
+        calls.append(time.monotonic())
+        return len(calls) >= 3
+
+    start = time.monotonic()
+    assert wait_until(pred, timeout_s=5) is True
+    # 25 ms + 37.5 ms of backoff, well under two fixed 250 ms polls
+    assert time.monotonic() - start < 0.3
+
+
+def test_wait_until_survives_raising_predicate_and_times_out() -> None:
+    def pred() -> bool:
+        raise RuntimeError("transient")
+
+    assert wait_until(pred, timeout_s=0) is False
+    assert wait_until(pred, timeout_s=1, poll_ms=50) is False
+
+
+def test_save_context_writes_state_atomically(tmp_path) -> None:
+    cfg = Config()
+    cfg.session.path = tmp_path / "sessions" / "state.json"
+    ctx = Mock()
+    ctx.storage_state.return_value = {"cookies": [{"name": "é"}], "origins": []}
+
+    save_context(ctx, cfg)
+
+    assert json.loads(cfg.session.path.read_text(encoding="utf-8")) == {
+        "cookies": [{"name": "é"}],
+        "origins": [],
+    }
+    # Only the final file remains; the temporary file was replaced
+    assert [p.name for p in cfg.session.path.parent.iterdir()] == ["state.json"]
+
+
+def test_state_file_follows_home_changes(tmp_path, monkeypatch) -> None:
+    cfg = Config()
+    cfg.session.site_host = "example.com"
+    rel = Path(".scraper", "sessions", "example.com", "default.json")
+
+    monkeypatch.setenv("HOME", str(tmp_path / "a"))
+    assert _state_file(cfg) == tmp_path / "a" / rel
+    monkeypatch.setenv("HOME", str(tmp_path / "b"))
+    assert _state_file(cfg) == tmp_path / "b" / rel
+
+
+def test_state_file_returns_explicit_path_as_path() -> None:
+    cfg = Config()
+    cfg.session.path = "state.json"
+    assert _state_file(cfg) == Path("state.json")
@@ -0,0 +1,63 @@
+import copy
+
+import pytest
+
+from hudascraper.hudasconfig import PaginationConfig
+
+
+def _pager_cfg(cfg, server):
+    # Point the test-site MS config at the three-page JS pager
+    cfg.base_url = f"{server}/pager.html"
+    cfg.pre_actions = []
+    cfg.session.reuse = False
+    cfg.session.headed_on_first_run = False
+    cfg.pagination = PaginationConfig(
+        strategy="next_button",
+        next_button={"button": {"candidates": [{"selector": "#next-page"}]}},
+    )
+    return cfg
+
+
+def _scrape(cfg):
+    from hudascraper.hudascraper import GenericScraper
+
+    scraper = GenericScraper(cfg, auth=None)
+    try:
+        return scraper.run()
+    finally:
+        scraper.close()
+
+
+@pytest.mark.integration
+def test_next_button_waits_for_xhr_page_swap(cfg_ms, test_site_server):
+    """
+    Every page of ``test-site/pager.html`` is read exactly once.
+
+    The pager replaces its rows 400 ms after "Next" is clicked, leaving the
+    previous rows attached meanwhile; reading too early would re-read page 1
+    and the next click would skip straight past page 2.
+    """
+    df = _scrape(_pager_cfg(cfg_ms, test_site_server))
+
+    assert df.attrs["page_count"] == 3
+    expected = [f"Row {p}.{i}" for p in (1, 2, 3) for i in (1, 2, 3)]
+    assert df["Name"].tolist() == expected
+
+
+@pytest.mark.integration
+def test_parallel_pages_match_sequential_read(cfg_ms, test_site_server):
+    """Fetching pages 2..N in worker browsers yields the sequential rows."""
+    sequential = _pager_cfg(cfg_ms, test_site_server)
+    parallel = copy.deepcopy(sequential)
+    parallel.selectors["page_count"] = {"candidates": [{"selector": "#page-label"}]}
+    parallel.data_normalization.update(
+        parallel_pages=2,
+        page_url_template=f"{test_site_server}/pager.html?page={{n}}",
+    )
+
+    seq_df = _scrape(sequential)
+    par_df = _scrape(parallel)
+
+    assert par_df.attrs["page_count"] == 3
+    assert par_df.values.tolist() == seq_df.values.tolist()
+    assert list(par_df.columns) == list(seq_df.columns)
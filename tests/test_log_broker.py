@@ -0,0 +1,34 @@
+import asyncio
+
+from hudascraper.web.hudascraper_log import LogBroker
+
+
+def test_publish_evicts_oldest_and_counts_drops():
+    async def scenario():
+        broker = LogBroker(max_queue_size=2)
+        q = broker.subscribe()
+        for i in range(5):
+            broker.publish(f"m{i}")
+        await asyncio.sleep(0)  # let the scheduled puts run
+        got = [q.get_nowait() for _ in range(q.qsize())]
+        return got, broker.take_dropped(q), broker.take_dropped(q)
+
+    got, dropped, after = asyncio.run(scenario())
+    assert got == ["m3", "m4"]
+    assert dropped == 3
+    assert after == 0
+
+
+def test_put_scheduled_before_unsubscribe_is_ignored():
+    async def scenario():
+        broker = LogBroker(max_queue_size=1)
+        q = broker.subscribe()
+        broker.publish("m0")
+        broker.publish("m1")  # would evict m0 and count a drop
+        broker.unsubscribe(q)
+        await asyncio.sleep(0)  # run the already-scheduled puts
+        return broker, q
+
+    broker, q = asyncio.run(scenario())
+    assert q.empty()
+    assert q not in broker._dropped
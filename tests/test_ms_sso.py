@@ -25,16 +25,16 @@ def test_ms_sso_fills_and_clicks_when_on_ms_host() -> None:
         "ms_signin": {"candidates": [{"selector": "#signin"}]},
     }
 
-    # Fake page that starts on MS host and supports wait_for_timeout
+    # Fake page that starts on MS host
     page = Mock()
     page.url = "https://login.microsoftonline.com/common/oauth2/v2.0/"
-    page.wait_for_timeout = Mock()
 
-    # Prepare distinct locator mocks so we can assert they were called
-    email_loc = Mock()
-    next_loc = Mock()
-    password_loc = Mock()
-    signin_loc = Mock()
+    # Distinct locator mocks keyed by selector so we can assert they were called
+    locators = {sel: Mock() for sel in ("#email", "#next", "#password", "#signin")}
+    email_loc = locators["#email"]
+    next_loc = locators["#next"]
+    password_loc = locators["#password"]
+    signin_loc = locators["#signin"]
 
     # Make signin click change the page URL to simulate redirect back to app
     def signin_click_side_effect():
@@ -42,21 +42,11 @@ def test_ms_sso_fills_and_clicks_when_on_ms_host() -> None:
 
     signin_loc.click.side_effect = signin_click_side_effect
 
-    # Resolver.locate should return the appropriate mock based on selector
-    def fake_locate(root, selset):
-        sel = selset.candidates[0].selector
-        if sel == "#email":
-            return email_loc
-        if sel == "#next":
-            return next_loc
-        if sel == "#password":
-            return password_loc
-        if sel == "#signin":
-            return signin_loc
-        return Mock()
-
+    # Resolver.locate returns the mock for the set's first selector
     resolver = Mock()
-    resolver.locate.side_effect = fake_locate
+    resolver.locate.side_effect = lambda root, selset: locators[
+        selset.candidates[0].selector
+    ]
 
     auth = MsSsoAuth(username="user@example.com", password="secret", timeout_s=5)
 
@@ -74,3 +64,37 @@ def test_ms_sso_fills_and_clicks_when_on_ms_host() -> None:
     # signin clicked and resulted in page leaving MS host
     assert signin_loc.click.called
     assert "app.example" in page.url
+    # Condition-based waits only: no fixed sleeps in the MS flow
+    assert page.wait_for_timeout.called is False
+
+
+def test_ms_sso_compiles_selector_sets_once_per_config() -> None:
+    cfg = Config()
+    cfg.selectors = {
+        "ms_email": {"candidates": [{"selector": "#email"}]},
+        "ms_next": {"candidates": [{"selector": "#next"}]},
+        "ms_password": {"candidates": [{"selector": "#password"}]},
+        "ms_signin": {"candidates": [{"selector": "#signin"}]},
+    }
+    auth = MsSsoAuth(username="user@example.com", password="secret")
+
+    first = auth._compile(cfg)
+    assert auth._compile(cfg) is first
+    # Without ms_app_signin the app trigger falls back to ms_signin
+    assert first["app_signin"].candidates[0].selector == "#signin"
+    assert auth._compile(Config()) is not first
+
+
+def _ms_config(email_selector: str) -> Config:
+    cfg = Config()
+    cfg.selectors = {"ms_email": {"candidates": [{"selector": email_selector}]}}
+    return cfg
+
+
+def test_ms_sso_recompiles_for_each_short_lived_config() -> None:
+    auth = MsSsoAuth(username="user@example.com", password="secret")
+    # Neither config is kept alive, so CPython may hand the second one the
+    # first one's id
+    for i in range(50):
+        email = auth._compile(_ms_config(f"#email-{i}"))["email"]
+        assert email.candidates[0].selector == f"#email-{i}"
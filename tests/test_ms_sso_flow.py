@@ -1,71 +1,23 @@
-import os
-import threading
-import time
-from functools import partial
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from pathlib import Path
-
 import pytest
 
-# Ensure Playwright is available for integration tests; skip otherwise.
-pytest.importorskip("playwright.sync_api")
-from playwright.sync_api import sync_playwright
-
-ROOT = Path(__file__).resolve().parents[1] / "test-site"
-
-
-def serve(dirpath: Path, port: int = 8000):
-    handler = partial(SimpleHTTPRequestHandler, directory=str(dirpath))
-    httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
-
-    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
-    thread.start()
-    return httpd, thread
+from tests._pw_helpers import fake_ms_login, goto_fast
 
 
 @pytest.mark.integration
-def test_ms_sso_flow_integration():
+def test_ms_sso_flow_integration(browser_context, test_site_server):
     """
     End-to-end MS SSO flow against the local `test-site/`.
 
     This test is intentionally gated behind an environment variable so it
     only runs when explicitly requested by a developer or CI job that has
-    Playwright and browser binaries installed.
+    Playwright and browser binaries installed (see ``conftest.py``).
     """
-    if os.environ.get("RUN_PLAYWRIGHT_INTEGRATION", "0") != "1":
-        pytest.skip("Set RUN_PLAYWRIGHT_INTEGRATION=1 to run Playwright integrations")
-
-    # sync_playwright is imported at module level
-    srv, thread = serve(ROOT, port=8000)
-    try:
-        # small delay for server to be reachable
-        time.sleep(0.1)
-        base = "http://127.0.0.1:8000/index.html"
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            ctx = browser.new_context()
-            page = ctx.new_page()
-
-            page.goto(base, wait_until="domcontentloaded")
-
-            # Click the app's ms-signin button
-            page.click("#ms-signin")
-
-            # Wait for ms-login page to load and fill fields
-            page.wait_for_selector("input[name='loginfmt']", timeout=5000)
-            page.fill("input[name='loginfmt']", "test@example.com")
-            page.click("#next")
+    base = f"{test_site_server}/index.html"
 
-            page.wait_for_selector("#pwd", timeout=5000)
-            page.fill("#pwd", "password")
-            page.click("#signin")
+    page = browser_context.new_page()
 
-            # Final page should be success.html
-            page.wait_for_url("**/success.html", timeout=5000)
-            assert "success.html" in page.url
+    goto_fast(page, base)
 
-            ctx.close()
-            browser.close()
-    finally:
-        srv.shutdown()
+    # Sign in through the fake MS form; returns once on success.html
+    fake_ms_login(page)
+    assert "success.html" in page.url
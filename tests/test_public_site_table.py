@@ -1,33 +1,40 @@
+from types import MappingProxyType
+
 import pytest
 
-from hudascraper.hudasconfig import load_config
 from hudascraper.hudascraper import GenericScraper
 
+# Selector bundle for the W3Schools "customers" table; read-only so a test
+# cannot mutate the shared copy
+_W3SCHOOLS_SELECTORS = MappingProxyType({
+    "table_container": {"candidates": [{"selector": "#customers", "engine": "css"}]},
+    "header_cells": {
+        "candidates": [{"selector": "thead th, tbody tr th", "engine": "css"}],
+    },
+    "row": {"candidates": [{"selector": "tbody tr", "engine": "css"}]},
+    "cell": {"candidates": [{"selector": "td, th", "engine": "css"}]},
+})
+
 
 @pytest.mark.integration
-def test_w3schools_table_quick():
+def test_w3schools_table_quick(cfg_ms, test_site_server):
     """
-    Quick smoke test that scrapes a simple public HTML table from W3Schools.
-    Gated by the integration marker because it requires Playwright/network.
+    Quick smoke test that scrapes the W3Schools "customers" table.
+
+    Uses the snapshot in ``test-site/w3schools_tables.html`` served locally,
+    so no network round-trip is involved. Gated by the integration marker
+    because it requires Playwright.
     """
-    cfg = load_config("config-testsite-ms.json")
-    # Replace base_url to a stable public page with a simple table
-    cfg.base_url = "https://www.w3schools.com/html/html_tables.asp"
+    cfg = cfg_ms
+    # Local copy of https://www.w3schools.com/html/html_tables.asp
+    cfg.base_url = f"{test_site_server}/w3schools_tables.html"
     # Keep headless and avoid session reuse
     cfg.headless = True
     if getattr(cfg, "session", None) is not None:
         cfg.session.reuse = False
         cfg.session.headed_on_first_run = False
 
-    # Table container selector for W3Schools sample table
-    cfg.selectors["table_container"] = {
-        "candidates": [{"selector": "#customers", "engine": "css"}],
-    }
-    cfg.selectors["header_cells"] = {
-        "candidates": [{"selector": "thead th, tbody tr th", "engine": "css"}],
-    }
-    cfg.selectors["row"] = {"candidates": [{"selector": "tbody tr", "engine": "css"}]}
-    cfg.selectors["cell"] = {"candidates": [{"selector": "td, th", "engine": "css"}]}
+    cfg.selectors.update(_W3SCHOOLS_SELECTORS)
 
     scraper = GenericScraper(cfg, auth=None)
     try:
@@ -1,13 +1,10 @@
-from pathlib import Path
-
 import pytest
 
-from hudascraper.hudasconfig import load_config
 from hudascraper.hudascraper import GenericScraper
 
 
 @pytest.mark.integration
-def test_scrape_sample_headless_quick():
+def test_scrape_sample_headless_quick(cfg_sample):
     """
     Run the `config-sample.json` scraper quickly in headless mode.
 
@@ -15,11 +12,7 @@ def test_scrape_sample_headless_quick():
     forces headless execution and disables session reuse so it is safe to run
     in CI-like environments.
     """
-    repo_root = Path(__file__).resolve().parent.parent
-    cfg_path = repo_root / "config-sample.json"
-    assert cfg_path.exists(), "config-sample.json must exist in repo root"
-
-    cfg = load_config(str(cfg_path))
+    cfg = cfg_sample
 
     # Force headless, no manual-headed first run, and don't reuse sessions
     cfg.headless = True
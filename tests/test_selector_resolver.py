@@ -0,0 +1,31 @@
+from unittest.mock import Mock
+
+from hudascraper.hudasconfig import SelectorCandidate, SelectorSet
+from hudascraper.hudascraper import SelectorResolver
+
+
+def test_inner_texts_waits_per_candidate_then_evaluates_once() -> None:
+    cand = SelectorCandidate("thead th", state="visible", timeout_ms=1234)
+    root = Mock()
+    root.first.evaluate.return_value = ["Name", "Value"]
+
+    texts = SelectorResolver(Mock()).inner_texts(root, SelectorSet([cand]))
+
+    assert texts == ["Name", "Value"]
+    root.locator.return_value.first.wait_for.assert_called_once_with(
+        state="visible",
+        timeout=1234,
+    )
+    root.locator.return_value.all_inner_texts.assert_not_called()
+
+
+def test_inner_texts_uses_all_inner_texts_for_xpath() -> None:
+    cand = SelectorCandidate("./thead//th", engine="xpath")
+    root = Mock()
+    root.locator.return_value.all_inner_texts.return_value = ["A"]
+
+    texts = SelectorResolver(Mock()).inner_texts(root, SelectorSet([cand]))
+
+    assert texts == ["A"]
+    root.locator.assert_called_once_with("xpath=./thead//th")
+    root.first.evaluate.assert_not_called()
@@ -0,0 +1,24 @@
+from hudascraper.hudascraper import GenericScraper
+
+
+def test_to_dataframe_pads_short_rows_and_uses_header() -> None:
+    rows = [["a", "b", "c"], ["d"], ["e", "f"]]
+    df = GenericScraper._to_dataframe(rows, ["Name", "", "Age"])
+
+    assert list(df.columns) == ["Name", "col_1", "Age"]
+    assert df.values.tolist() == [["a", "b", "c"], ["d", "", ""], ["e", "f", ""]]
+
+
+def test_to_dataframe_falls_back_to_positional_columns() -> None:
+    df = GenericScraper._to_dataframe([["x", "y"]], ["only-one"])
+    assert list(df.columns) == ["col_0", "col_1"]
+
+
+def test_to_dataframe_empty() -> None:
+    assert GenericScraper._to_dataframe([], None).empty
+
+
+def test_to_dataframe_uniform_rows() -> None:
+    rows = [["a", "b"], ["c", "d"]]
+    df = GenericScraper._to_dataframe(rows, ["x", "y"], max_len=2)
+    assert df.values.tolist() == rows
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
@@ -18,39 +18,62 @@ def test_safe_json_loads_invalid(bad):
         web._safe_json_loads(bad)
 
 
-def test_post_scrape_wrapped_and_params():
+def test_post_scrape_wrapped_and_params(monkeypatch):
     sample_cfg = {"hello": "world"}
     fake_resp = Mock()
     fake_resp.json.return_value = {"run_id": "abc123"}
     fake_resp.raise_for_status.return_value = None
 
-    with patch("hudascraper_web.requests.post", return_value=fake_resp) as post:
-        res = web._post_scrape(
-            "http://example.local/",
-            sample_cfg,
-            wrapped=True,
-            username="u",
-            password="p",
-        )
-        assert res["run_id"] == "abc123"
-        post.assert_called_once()
-        called_url = (
-            post.call_args[1]["url"]
-            if "url" in post.call_args[1]
-            else post.call_args[0][0]
-        )
-        assert "example.local" in called_url
-
-
-def test_get_results_returns_dataframe_like():
-    # Build a fake JSON response that would come from the /results endpoint
-    fake_items = [{"x": 1}, {"x": 2}]
-    fake_resp = Mock()
-    fake_resp.json.return_value = {"items": fake_items}
+    # Record (args, kwargs) without the Session instance
+    calls = []
+    monkeypatch.setattr(
+        "hudascraper_web.requests.Session.post",
+        lambda _self, *a, **kw: calls.append((a, kw)) or fake_resp,
+    )
+    res = web._post_scrape(
+        "http://example.local/",
+        sample_cfg,
+        wrapped=True,
+        username="u",
+        password="p",
+    )
+    assert res["run_id"] == "abc123"
+    assert len(calls) == 1
+    args, kwargs = calls[0]
+    called_url = kwargs["url"] if "url" in kwargs else args[0]
+    assert "example.local" in called_url
+
+
+def test_get_results_returns_dataframe_like(monkeypatch):
+    # Build a fake NDJSON response that would come from the /results endpoint
+    fake_resp = MagicMock()
+    fake_resp.__enter__.return_value = fake_resp
+    fake_resp.iter_lines.return_value = [b'{"x": 1}', b"", b'{"x": 2}']
     fake_resp.raise_for_status.return_value = None
 
-    with patch("hudascraper_web.requests.get", return_value=fake_resp):
-        df = web._get_results("http://example.local/", "run1")
-        # Expect a pandas DataFrame; at minimum it should have iterrows
-        assert hasattr(df, "iterrows")
-        assert len(list(df.iterrows())) == 2
+    monkeypatch.setattr(
+        "hudascraper_web.requests.Session.get",
+        lambda _self, *a, **kw: fake_resp,
+    )
+    df = web._get_results("http://example.local/", "run1")
+    # Expect a pandas DataFrame with the blank line skipped
+    assert hasattr(df, "iterrows")
+    assert len(df) == 2
+    assert df["x"].tolist() == [1, 2]
+    # The streamed response was closed (context manager exited)
+    fake_resp.__exit__.assert_called_once()
+
+
+def test_csv_bytes_matches_to_csv_and_is_keyed_per_server():
+    import pandas as pd
+
+    a = pd.DataFrame({"name": ["x, y", "z"], "n": [1, 2]})
+    b = pd.DataFrame({"name": ["other"], "n": [3]})
+
+    assert web._csv_bytes("http://a.local", "run1", a) == a.to_csv(
+        index=False,
+    ).encode("utf-8")
+    # Same run_id on another server is a different cache entry
+    assert web._csv_bytes("http://b.local", "run1", b) == b.to_csv(
+        index=False,
+    ).encode("utf-8")